@@ -422,7 +422,7 @@ class FIT:
         (mode, ino, dev, nlink, uid, gid, size, atime, mtime, ctime) = os.stat(infile)
         infilename_and_filedate= '{} {}'.format(os.path.basename(infile),time.strftime('%Y-%m-%d %H:%M:%S',time.gmtime(mtime)))
         # Load the FIT file
-        fitfile = FitFile(infile)
+        fitfile = FitFile(infile, buffered=True)
         locations={'name':[], 'latitude':[], 'longitude':[], 'ele':[], 'sym':[], 'unknown_5':[],'unknown_6':[], 'unknown_253':[],'unknown_254':[], 'src':[]}
         loc_no = 0
         for location in fitfile.get_messages('unknown_29'):
@@ -455,7 +455,7 @@ class FIT:
 
     def fit2gpx_and_sqlite(self, infile): 
         # Load the FIT file
-        fitfile = FitFile(infile)
+        fitfile = FitFile(infile, buffered=True)
         # ------------------- activities -------------------------------
         activities={}
 
@@ -2,7 +2,9 @@
 
 # Make classes available
 from fitparse.base import FitFile, FitFileDecoder, UncachedFitFile, \
-                          FitParseError, CacheMixin, DataProcessorMixin
+                          FitParseError, CacheMixin, CachePolicy, DataProcessorMixin
+from fitparse.index import MessageIndex
+from fitparse.parallel import decode_many
 from fitparse.records import DataMessage
 from fitparse.processors import FitFileDataProcessor, StandardUnitsDataProcessor
 
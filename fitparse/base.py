@@ -1,23 +1,65 @@
 #!/usr/bin/env python
 
+import bisect
+from collections import OrderedDict, namedtuple
+import heapq
 import io
 import os
 import struct
+import threading
 import warnings
 
 # Python 2 compat
 try:
+    int_types = (int, long)
     num_types = (int, float, long)
 except NameError:
+    int_types = (int,)
     num_types = (int, float)
 
-from fitparse.processors import FitFileDataProcessor
+from fitparse.codegen import accumulates, compile_decode_function, compile_row_function, field_names
+from fitparse.index import CHECKPOINT_INTERVAL, Checkpoint, MessageIndex
+from fitparse.processors import EPOCH_TYPE_CONVERTERS, FitFileDataProcessor, fit_timestamp
 from fitparse.profile import FIELD_TYPE_TIMESTAMP, MESSAGE_TYPES
 from fitparse.records import (
-    Crc, DevField, DataMessage, FieldData, FieldDefinition, DevFieldDefinition, DefinitionMessage,
-    MessageHeader, BASE_TYPES, BASE_TYPE_BYTE,
+    Crc, DevField, DataMessage, LazyDataMessage, FieldData, FieldDefinition, DevFieldDefinition, DefinitionMessage,
+    MessageHeader, ProjectedDataMessage, BASE_TYPES, BASE_TYPE_BYTE, field_sort_key,
 )
-from fitparse.utils import fileish_open, is_iterable, FitParseError, FitEOFError, FitCRCError, FitHeaderError
+from fitparse.utils import fileish_open, fileish_buffer, is_iterable, FitParseError, FitEOFError, FitCRCError, FitHeaderError
+
+# Message numbers of developer_data_id and field_description, which describe
+# developer fields and so are always decoded
+DEV_DATA_MESG_NUMS = (206, 207)
+
+
+def _make_message_header(header):
+    if header & 0x80:  # bit 7: Is this record a compressed timestamp?
+        return MessageHeader(
+            is_definition=False,
+            is_developer_data=False,
+            local_mesg_num=(header >> 5) & 0x3,  # bits 5-6
+            time_offset=header & 0x1F,  # bits 0-4
+        )
+    else:
+        return MessageHeader(
+            is_definition=bool(header & 0x40),  # bit 6
+            is_developer_data=bool(header & 0x20), # bit 5
+            local_mesg_num=header & 0xF,  # bits 0-3
+            time_offset=None,
+        )
+
+
+# Message headers are never modified, so there's one shared header per
+# header byte rather than a new one per message
+MESSAGE_HEADERS = tuple(_make_message_header(header) for header in range(256))
+
+# Compiled definitions, shared by all decoders in the process since devices
+# repeat the same definitions within and across files. Keyed by the raw
+# definition bytes, dropping the least recently used first.
+DEFINITION_CACHE_SIZE = 512
+_definition_cache = OrderedDict()
+# Decoders in different threads share the cache too
+_definition_cache_lock = threading.Lock()
 
 
 class DeveloperDataMixin(object):
@@ -127,16 +169,39 @@ class DeveloperDataMixin(object):
 class FitFileDecoder(DeveloperDataMixin):
     """Basic decoder for fit files"""
 
-    def __init__(self, fileish, *args, check_crc=True, data_processor=None, **kwargs):
-        self._file = fileish_open(fileish, 'rb')
+    def __init__(self, fileish, *args, check_crc=True, data_processor=None, buffered=False, lazy=False,
+                 numpy_arrays=False, **kwargs):
+        self._fileish = fileish
+
+        # In lazy mode data messages keep their raw payload and only decode
+        # their fields when first used
+        self._lazy = lazy
+
+        # In numpy_arrays mode multi-value numeric fields are decoded to float64
+        # NumPy arrays (NaN for invalid values) instead of tuples
+        self._numpy_arrays = numpy_arrays
+
+        # In buffered mode the whole file is loaded (or memory mapped) up front
+        # and decoded from a moving offset, instead of reading field by field
+        if buffered:
+            self._file = None
+            self._buffer, self._mmap = fileish_buffer(fileish)
+            self._filesize = len(self._buffer)
+        else:
+            self._buffer = self._mmap = None
+            self._file = fileish_open(fileish, 'rb')
+            # File objects passed in belong to the caller and are left open,
+            # as later passes over the file (like cache replays) read them again
+            self._owns_file = self._file is not fileish
+
+            # Get total filesize
+            self._file.seek(0, os.SEEK_END)
+            self._filesize = self._file.tell()
+            self._file.seek(0, os.SEEK_SET)
 
         self.check_crc = check_crc
         self._crc = None
-
-        # Get total filesize
-        self._file.seek(0, os.SEEK_END)
-        self._filesize = self._file.tell()
-        self._file.seek(0, os.SEEK_SET)
+        self._offset = 0
 
         # Start off by parsing the file header (sets initial attribute values)
         self._parse_file_header()
@@ -148,8 +213,20 @@ class FitFileDecoder(DeveloperDataMixin):
 
     def close(self):
         if hasattr(self, "_file") and self._file and hasattr(self._file, "close"):
-            self._file.close()
+            if self._owns_file:
+                self._file.close()
             self._file = None
+        if getattr(self, "_buffer", None) is not None:
+            buffer, self._buffer = self._buffer, None
+            if self._mmap is not None:
+                try:
+                    buffer.release()
+                    self._mmap.close()
+                except BufferError:
+                    # Slices of the buffer are still referenced elsewhere,
+                    # leave the map to be closed when they are collected
+                    pass
+                self._mmap = None
 
     def __enter__(self):
         return self
@@ -163,13 +240,22 @@ class FitFileDecoder(DeveloperDataMixin):
     def _read(self, size):
         if size <= 0:
             return None
-        data = self._file.read(size)
+        if self._buffer is not None:
+            # The CRC is checked over the whole buffered segment at once
+            # in _read_and_assert_crc, so it isn't updated here
+            data = self._buffer[self._offset:self._offset + size]
+        else:
+            data = self._file.read(size)
+            if self.check_crc:
+                self._crc.update(data)
         if size != len(data):
+            # What was there is read either way, so that decoding carries on
+            # from the end of the file in both modes
+            self._offset += len(data)
+            self._bytes_left -= len(data)
             raise FitEOFError("Tried to read %d bytes from .FIT file but got %d" % (size, len(data)))
-
-        if self.check_crc:
-            self._crc.update(data)
-        self._bytes_left -= len(data)
+        self._offset += size
+        self._bytes_left -= size
         return data
 
     def _read_struct(self, fmt, endian='<', data=None, always_tuple=False):
@@ -188,9 +274,16 @@ class FitFileDecoder(DeveloperDataMixin):
     def _read_and_assert_crc(self, allow_zero=False):
         # CRC Calculation is little endian from SDK
         # TODO - How to handle the case of unterminated file? Error out and have user retry with check_crc=false?
-        crc_computed, crc_read = self._crc.value, self._read_struct(Crc.FMT)
         if not self.check_crc:
+            # Skip over the CRC, tolerating files where it is missing
+            self._read(min(struct.calcsize(Crc.FMT), self._filesize - self._offset))
             return
+        if self._buffer is not None:
+            # Deferred mode, checksum everything read since the segment started
+            crc_computed = Crc.calculate(self._buffer[self._crc_start:self._offset])
+        else:
+            crc_computed = self._crc.value
+        crc_read = self._read_struct(Crc.FMT)
         if crc_computed == crc_read or (allow_zero and crc_read == 0):
             return
         raise FitCRCError('CRC Mismatch [computed: %s, read: %s]' % (
@@ -207,6 +300,7 @@ class FitFileDecoder(DeveloperDataMixin):
         self._complete = False
         self._compressed_ts_accumulator = 0
         self._crc = Crc()
+        self._crc_start = self._offset
         self._local_mesgs = {}
 
         header_data = self._read(12)
@@ -237,64 +331,142 @@ class FitFileDecoder(DeveloperDataMixin):
         # After we've consumed the header, set the bytes left to be read
         self._bytes_left = data_size
 
-    def _parse_message(self):
-        # When done, calculate the CRC and return None
-        if self._bytes_left <= 0:
-            # Don't assert CRC if requested not
-            if not self._complete and self.check_crc:
-                self._read_and_assert_crc()
+    def _parse_message(self, fields=None):
+        header = self._next_message_header()
+        if header is None:
+            return None
 
-            if self._file.tell() >= self._filesize:
-                self._complete = True
-                self.close()
-                return None
+        if header.is_definition:
+            message = self._parse_definition_message(header)
+        else:
+            message = self._parse_data_message(header, fields)
+            self._update_dev_data(message)
 
-            # Still have data left in the file - assuming chained fit files
-            self._parse_file_header()
-            return self._parse_message()
+        return message
 
-        header = self._parse_message_header()
+    def _parse_named_message(self, names, fields=None):
+        # Like _parse_message, but data messages not named in names are skipped
+        # by size instead of being decoded, returning None
+        header = self._next_message_header()
+        if header is None:
+            return None
+
+        if not header.is_definition:
+            def_mesg = self._local_mesgs.get(header.local_mesg_num)
+            if def_mesg and not self._is_named(def_mesg, names) and def_mesg.mesg_num not in DEV_DATA_MESG_NUMS:
+                self._skip_data_message(header, def_mesg)
+                return None
 
         if header.is_definition:
             message = self._parse_definition_message(header)
         else:
-            message = self._parse_data_message(header)
-            if message.mesg_type is not None:
-                if message.mesg_type.name == 'developer_data_id':
-                    self.add_dev_data_id(message)
-                elif message.mesg_type.name == 'field_description':
-                    self.add_dev_field_description(message)
+            message = self._parse_data_message(header, fields)
+            self._update_dev_data(message)
 
         return message
 
+    def _next_message_header(self):
+        # When done, calculate the CRC and return None
+        while self._bytes_left <= 0:
+            if self._finish_segment():
+                return None
+
+        return self._parse_message_header()
+
+    def _finish_segment(self):
+        # Consume the CRC (only asserted if requested)
+        if not self._complete:
+            self._read_and_assert_crc()
+
+        if self._offset >= self._filesize:
+            self._complete = True
+            # Buffered decoders hold on to their buffer for later passes
+            if self._buffer is None:
+                self.close()
+            return True
+
+        # Still have data left in the file - assuming chained fit files
+        self._parse_file_header()
+        return False
+
+    def _update_dev_data(self, message):
+        if message.mesg_type is not None:
+            if message.mesg_type.name == 'developer_data_id':
+                self.add_dev_data_id(message)
+            elif message.mesg_type.name == 'field_description':
+                self.add_dev_field_description(message)
+
     def _parse_message_header(self):
-        header = self._read_struct('B')
-
-        if header & 0x80:  # bit 7: Is this record a compressed timestamp?
-            return MessageHeader(
-                is_definition=False,
-                is_developer_data=False,
-                local_mesg_num=(header >> 5) & 0x3,  # bits 5-6
-                time_offset=header & 0x1F,  # bits 0-4
-            )
-        else:
-            return MessageHeader(
-                is_definition=bool(header & 0x40),  # bit 6
-                is_developer_data=bool(header & 0x20), # bit 5
-                local_mesg_num=header & 0xF,  # bits 0-3
-                time_offset=None,
-            )
+        return MESSAGE_HEADERS[self._read(1)[0]]
 
     def _parse_definition_message(self, header):
-        # Read reserved byte and architecture byte to resolve endian
-        endian = '>' if self._read_struct('xB') else '<'
-        # Read rest of header with endian awareness
-        global_mesg_num, num_fields = self._read_struct('HB', endian=endian)
+        # Read the whole definition up front, as its raw bytes identify it.
+        # Reserved byte and architecture byte to resolve endian first
+        raw = bytes(self._read(5))
+        endian = '>' if raw[1] else '<'
+        # Rest of header with endian awareness
+        global_mesg_num, num_fields = struct.unpack(endian + 'HB', raw[2:])
+        raw += bytes(self._read(num_fields * 3) or b'')
+
+        dev_fields = []
+        if header.is_developer_data:
+            num_dev_fields = self._read_struct('B', endian=endian)
+            dev_raw = bytes(self._read(num_dev_fields * 3) or b'')
+            raw += bytes((num_dev_fields,)) + dev_raw
+            for n in range(0, len(dev_raw), 3):
+                field_def_num, field_size, dev_data_index = dev_raw[n:n + 3]
+                field = self.get_dev_type(dev_data_index, field_def_num)
+                dev_fields.append((field, field_def_num, field_size, dev_data_index))
+
+        # Developer fields are described by the file, so their descriptions
+        # are part of what identifies the definition
+        key = (raw, self._numpy_arrays, tuple(
+            (field.type, field.name, field.units, field.native_field_num) for field, _, _, _ in dev_fields
+        ))
+        with _definition_cache_lock:
+            template = _definition_cache.get(key)
+            if template is not None:
+                _definition_cache.move_to_end(key)
+        if template is None:
+            # Compiled outside of the lock. Should another thread compile the
+            # same definition meanwhile, the one cached first is used
+            template = self._compile_definition(
+                endian, global_mesg_num, raw[5:5 + num_fields * 3], dev_fields,
+            )
+            with _definition_cache_lock:
+                template = _definition_cache.setdefault(key, template)
+                _definition_cache.move_to_end(key)
+                if len(_definition_cache) > DEFINITION_CACHE_SIZE:
+                    _definition_cache.popitem(last=False)
+
+        # Every occurrence is its own definition message, sharing what was
+        # compiled for the first one
+        def_mesg = DefinitionMessage(header=header, **dict(
+            (name, getattr(template, name)) for name in DefinitionMessage.__slots__ if name != 'header'
+        ))
+
+        # If the fields have components that are accumulators
+        # start recording their accumulation at 0
+        if def_mesg.accumulates:
+            accumulators = self._accumulators.setdefault(global_mesg_num, {})
+            for field_def in def_mesg.field_defs:
+                if field_def.field and field_def.field.components:
+                    for component in field_def.field.components:
+                        if component.accumulate:
+                            accumulators[component.def_num] = 0
+
+        self._local_mesgs[header.local_mesg_num] = def_mesg
+        return def_mesg
+
+    def _compile_definition(self, endian, global_mesg_num, field_raw, dev_fields):
+        # Build a definition message (without its header) from the raw field
+        # definitions, along with everything precompiled for decoding its data
         mesg_type = MESSAGE_TYPES.get(global_mesg_num)
         field_defs = []
+        accumulates = False
 
-        for n in range(num_fields):
-            field_def_num, field_size, base_type_num = self._read_struct('3B', endian=endian)
+        for n in range(0, len(field_raw), 3):
+            field_def_num, field_size, base_type_num = field_raw[n:n + 3]
             # Try to get field from message type (None if unknown)
             field = mesg_type.fields.get(field_def_num) if mesg_type else None
             base_type = BASE_TYPES.get(base_type_num, BASE_TYPE_BYTE)
@@ -306,13 +478,8 @@ class FitFileDecoder(DeveloperDataMixin):
                 )
                 base_type = BASE_TYPE_BYTE
 
-            # If the field has components that are accumulators
-            # start recording their accumulation at 0
-            if field and field.components:
-                for component in field.components:
-                    if component.accumulate:
-                        accumulators = self._accumulators.setdefault(global_mesg_num, {})
-                        accumulators[component.def_num] = 0
+            if field and any(component.accumulate for component in field.components or ()):
+                accumulates = True
 
             field_defs.append(FieldDefinition(
                 field=field,
@@ -322,78 +489,388 @@ class FitFileDecoder(DeveloperDataMixin):
             ))
 
         dev_field_defs = []
-        if header.is_developer_data:
-            num_dev_fields = self._read_struct('B', endian=endian)
-            for n in range(num_dev_fields):
-                field_def_num, field_size, dev_data_index = self._read_struct('3B', endian=endian)
-                field = self.get_dev_type(dev_data_index, field_def_num)
-                dev_field_defs.append(DevFieldDefinition(
-                    field=field,
-                    dev_data_index=dev_data_index,
-                    def_num=field_def_num,
-                    size=field_size
-                  ))
+        for field, field_def_num, field_size, dev_data_index in dev_fields:
+            dev_field_defs.append(DevFieldDefinition(
+                field=field,
+                dev_data_index=dev_data_index,
+                def_num=field_def_num,
+                size=field_size
+              ))
+
+        data_struct, value_slices, field_offsets = self._compile_data_struct(endian, field_defs + dev_field_defs)
+        array_unpackers = {}
+        if self._numpy_arrays:
+            array_unpackers = self._compile_array_unpackers(
+                endian, field_defs + dev_field_defs, value_slices, field_offsets,
+            )
+
+        # Remember where the timestamp lives, so the compressed timestamp can be
+        # tracked for data messages that are not fully decoded
+        timestamp_index = None
+        for n, field_def in enumerate(field_defs + dev_field_defs):
+            if field_def.def_num == FIELD_TYPE_TIMESTAMP.def_num:
+                timestamp_index = n
 
         def_mesg = DefinitionMessage(
-            header=header,
+            header=None,
             endian=endian,
             mesg_type=mesg_type,
             mesg_num=global_mesg_num,
             field_defs=field_defs,
             dev_field_defs=dev_field_defs,
+            data_struct=data_struct,
+            value_slices=value_slices,
+            field_offsets=field_offsets,
+            array_unpackers=array_unpackers,
+            timestamp_index=timestamp_index,
+            accumulates=accumulates,
+            subfield_plans=self._compile_subfield_plans(mesg_type, field_defs),
+            component_plans={},
+            projections={},
+            row_functions={},
         )
-        self._local_mesgs[header.local_mesg_num] = def_mesg
+        def_mesg.field_layouts = self._compile_field_layouts(def_mesg)
+        def_mesg.decode_function = compile_decode_function(def_mesg)
         return def_mesg
 
-    def _parse_raw_values_from_data_message(self, def_mesg):
-        # Go through mesg's field defs and read them
-        raw_values = []
-        for field_def in def_mesg.field_defs + def_mesg.dev_field_defs:
+    @staticmethod
+    def _compile_data_struct(endian, field_defs, skipped=()):
+        # Build one struct for the whole data message layout, along with the
+        # (start, stop) slice of the unpacked values and the byte offset
+        # belonging to each field. Fields numbered in skipped are padding,
+        # with an empty slice.
+        struct_fmt = endian
+        value_slices = []
+        field_offsets = []
+        num_values = 0
+        offset = 0
+        for n, field_def in enumerate(field_defs):
             base_type = field_def.base_type
-            is_byte = base_type.name == 'byte'
-            # Struct to read n base types (field def size / base type size)
-            struct_fmt = str(int(field_def.size / base_type.size)) + base_type.fmt
+            field_offsets.append(offset)
+            offset += field_def.size
+            if n in skipped:
+                if field_def.size:
+                    struct_fmt += '%dx' % field_def.size
+                value_slices.append((num_values, num_values))
+                continue
+            count, padding = divmod(field_def.size, base_type.size)
+            if base_type.fmt == 's' or base_type.name == 'byte':
+                # Strings and byte arrays are unpacked as a single bytes value
+                struct_fmt += '%ds' % field_def.size
+                value_slices.append((num_values, num_values + 1))
+                num_values += 1
+                continue
+            struct_fmt += '%d%s' % (count, base_type.fmt)
+            if padding:
+                struct_fmt += '%dx' % padding
+            value_slices.append((num_values, num_values + count))
+            num_values += count
+        return struct.Struct(struct_fmt), value_slices, field_offsets
+
+    def _compile_projection(self, def_mesg, fields):
+        # Decode function for only the fields (and components) named in fields
+        data_struct, value_slices = self._compile_projected_struct(def_mesg, fields)
+        return compile_decode_function(def_mesg, fields, data_struct, value_slices)
+
+    def _compile_projected_struct(self, def_mesg, fields):
+        # Struct and value slices unpacking what decoding the fields (and
+        # components) named in fields reads. The other values are skipped
+        # over; the timestamp, reference fields of subfields and fields with
+        # accumulated components are still unpacked to keep the decoder
+        # state right.
+        field_defs = def_mesg.field_defs + def_mesg.dev_field_defs
+        needed = set()
+        for n, field_def in enumerate(field_defs):
+            field = field_def.field
+            if n == def_mesg.timestamp_index:
+                needed.add(n)
+            if not (field_names(def_mesg, field_def) & fields or accumulates(field)):
+                continue
+            needed.add(n)
+            if field is None or not def_mesg.mesg_type:
+                continue
+            # Subfields of the field and of the fields its components go to
+            dynamic_fields = [field]
+            for field_or_subfield in (field,) + tuple(field.subfields or ()):
+                for component in field_or_subfield.components or ():
+                    dynamic_fields.append(def_mesg.mesg_type.fields.get(component.def_num))
+            for dynamic_field in dynamic_fields:
+                if dynamic_field is not None and dynamic_field.subfields:
+                    needed.update(index for index, _ in def_mesg.subfield_plans.get(dynamic_field.def_num, ()))
+
+        skipped = set(range(len(field_defs))) - needed
+        data_struct, value_slices, _ = self._compile_data_struct(def_mesg.endian, field_defs, skipped)
+        return data_struct, value_slices
+
+    def _compile_row_function(self, def_mesg, fields):
+        # Row function of a definition for iter_rows() (see
+        # compile_row_function), or one picking the values out of the
+        # projected FieldData for definitions it can't do
+        projected = frozenset(fields)
+        data_struct, value_slices = self._compile_projected_struct(def_mesg, projected)
+        row_function = compile_row_function(def_mesg, fields, data_struct, value_slices)
+        if row_function is not None:
+            return row_function
+
+        # (position, epoch converter) of each of fields among the FieldData
+        # decoded, worked out once for every set of them subfields decode to
+        layouts = {}
+
+        def row_function(decoder, data, timestamp):
+            _, field_datas = decoder._decode_payload(def_mesg, data, projected)
+            if timestamp is not None and def_mesg.timestamp_index is None:
+                # From a compressed timestamp header
+                field_datas.append(decoder._timestamp_field_data(timestamp))
+            key = tuple([field_data.field for field_data in field_datas])
+            layout = layouts.get(key)
+            if layout is None:
+                layout = layouts[key] = decoder._compile_row_layout(field_datas, fields)
+            row = []
+            for position, converter in layout:
+                if position is None:
+                    row.append(None)
+                elif converter is None:
+                    row.append(field_datas[position].value)
+                else:
+                    row.append(converter(field_datas[position].value))
+            return tuple(row)
+        return row_function
 
-            # Extract the raw value, ask for a tuple if it's a byte type
-            try:
-                raw_value = self._read_struct(
-                    struct_fmt, endian=def_mesg.endian, always_tuple=is_byte,
-                )
-            except FitEOFError:
-                # file was suddenly terminated
-                warnings.warn("File was terminated unexpectedly, some data will not be loaded.")
-                break
+    @staticmethod
+    def _compile_row_layout(field_datas, fields):
+        # Picks the first FieldData named each of fields, like DataMessage.get()
+        layout = []
+        for name in fields:
+            for position, field_data in enumerate(field_datas):
+                if field_data.is_named(name):
+                    layout.append((position, EPOCH_TYPE_CONVERTERS.get(field_data.type.name)))
+                    break
+            else:
+                layout.append((None, None))
+        return tuple(layout)
 
-            # If the field returns with a tuple of values it's definitely an
-            # oddball, but we'll parse it on a per-value basis it.
-            # If it's a byte type, treat the tuple as a single value
-            if isinstance(raw_value, tuple) and not is_byte:
-                raw_value = tuple(base_type.parse(rv) for rv in raw_value)
+    @staticmethod
+    def _compile_array_unpackers(endian, field_defs, value_slices, field_offsets):
+        # Multi-value fields of plain numeric types, keyed by the position of
+        # their first unpacked value. Named types, components and subfields
+        # are worked out one value at a time, so those stay tuples.
+        # Imported here so NumPy is only loaded when arrays are asked for
+        from fitparse.columns import compile_array_unpacker
+
+        array_unpackers = {}
+        for field_def, (start, stop), offset in zip(field_defs, value_slices, field_offsets):
+            base_type = field_def.base_type
+            # 64 bit integers don't fit float64 arrays
+            if stop - start < 2 or base_type.fmt in 'sqQ' or base_type.name == 'byte':
+                continue
+            field = field_def.field
+            if field is not None and (not field.is_base_type or field.components or field.subfields):
+                continue
+            array_unpackers[start] = compile_array_unpacker(endian, field_def, offset)
+        return array_unpackers
+
+    @staticmethod
+    def _unpack_raw_values(def_mesg, data):
+        values = def_mesg.data_struct.unpack(data) if data else ()
+
+        raw_values = []
+        for field_def, (start, stop) in zip(def_mesg.field_defs + def_mesg.dev_field_defs, def_mesg.value_slices):
+            base_type = field_def.base_type
+            if start == stop:
+                raw_value = None
+            elif stop - start > 1:
+                # If the field has multiple values it's definitely an
+                # oddball, but we'll parse it on a per-value basis it.
+                # (or as a whole, in numpy_arrays mode)
+                unpacker = def_mesg.array_unpackers.get(start) if def_mesg.array_unpackers else None
+                if unpacker is not None:
+                    raw_value = unpacker(data)
+                else:
+                    raw_value = tuple(base_type.parse(rv) for rv in values[start:stop])
             else:
                 # Otherwise, just scrub the singular value
-                raw_value = base_type.parse(raw_value)
+                raw_value = base_type.parse(values[start])
 
             raw_values.append(raw_value)
         return raw_values
 
+    def _skip_data_message(self, header, def_mesg, accumulate=True):
+        # Consume a data message without decoding it, only keeping the
+        # compressed timestamp (and unless told otherwise, the accumulated
+        # components) up to date. Returns the raw payload and the message's
+        # raw timestamp (None if it has none)
+        data = self._read(def_mesg.data_struct.size)
+
+        timestamp = None
+        if def_mesg.timestamp_index is not None:
+            timestamp = self._unpack_raw_value(def_mesg, data, def_mesg.timestamp_index)
+            if timestamp is not None:
+                self._compressed_ts_accumulator = timestamp
+
+        if header.time_offset is not None:
+            timestamp = self._compressed_ts_accumulator = self._apply_compressed_accumulation(
+                header.time_offset, self._compressed_ts_accumulator, 5,
+            )
+
+        # Later messages of this type build on the accumulated values
+        if accumulate and def_mesg.accumulates:
+            self._accumulate_components(def_mesg, self._unpack_raw_values(def_mesg, data))
+
+        return data, timestamp
+
+    def _accumulate_components(self, def_mesg, raw_values):
+        # Update the accumulated component values the way decoding the
+        # message would, without building any of its fields
+        for field_def, raw_value in zip(def_mesg.field_defs, raw_values):
+            if not field_def.field:
+                continue
+            field, _ = self._resolve_subfield(field_def.field, def_mesg, raw_values)
+            if not field.components:
+                continue
+            plan = def_mesg.component_plans.get(field) or self._compile_component_plan(def_mesg, field)
+            cmp_source, num_bits = self._component_source(raw_value)
+            for component, _, bit_offset, mask, _, _ in plan:
+                if not component.accumulate or cmp_source is None:
+                    continue
+                if num_bits is not None and bit_offset and bit_offset >= num_bits:
+                    continue
+                cmp_raw_value = cmp_source
+                if isinstance(cmp_raw_value, int_types):
+                    cmp_raw_value = (cmp_raw_value >> bit_offset) & mask
+                accumulator = self._accumulators[def_mesg.mesg_num]
+                accumulator[component.def_num] = self._apply_compressed_accumulation(
+                    cmp_raw_value, accumulator[component.def_num], component.bits,
+                )
+
+    @staticmethod
+    def _compile_component_plan(def_mesg, field):
+        # Flatten the components of a field (or subfield) into
+        # (component, target field, bit offset, mask, scale, offset) once per definition
+        plan = def_mesg.component_plans[field] = tuple(
+            (
+                component,
+                def_mesg.mesg_type.fields[component.def_num],
+                component.bit_offset,
+                (1 << component.bits) - 1,
+                component.scale,
+                component.offset,
+            )
+            for component in field.components
+        )
+        return plan
+
+    @classmethod
+    def _compile_field_layouts(cls, def_mesg):
+        # When every data message of a definition decodes to the same fields,
+        # index their names and def nums (first match wins, like a scan with
+        # FieldData.is_named) and work out the order DataMessage iterates them
+        # in, along with the (field, field_def) of each FieldData the layout
+        # is for. Keyed by whether the message has a compressed timestamp
+        # header, which adds a timestamp field at the end
+        fields = []
+        for field_def in def_mesg.field_defs + def_mesg.dev_field_defs:
+            field = field_def.field
+            if field is not None:
+                # Subfields change the names of fields from message to message
+                if field.subfields:
+                    return None
+                if field.components:
+                    # Arrays drop the components that don't fit, unless invalid
+                    num_bits = None
+                    if field_def.base_type.name == 'byte':
+                        num_bits = field_def.size << 3
+                    elif field_def.size > field_def.base_type.size:
+                        num_bits = (field_def.size // field_def.base_type.size) << 3
+                    plan = def_mesg.component_plans.get(field) or cls._compile_component_plan(def_mesg, field)
+                    for component, cmp_field, bit_offset, _, _, _ in plan:
+                        if cmp_field.subfields or (num_bits is not None and bit_offset and bit_offset >= num_bits):
+                            return None
+                        fields.append(FieldData(field_def=None, field=cmp_field))
+            fields.append(FieldData(field_def=field_def, field=field))
+
+        layouts = {}
+        for compressed_ts, field_datas in (
+                (False, fields), (True, fields + [FieldData(field_def=None, field=FIELD_TYPE_TIMESTAMP)])):
+            positions = {}
+            for position, field_data in enumerate(field_datas):
+                names = []
+                if field_data.field:
+                    names += [field_data.field.name, field_data.field.def_num]
+                if field_data.field_def:
+                    names.append(field_data.field_def.def_num)
+                for name in names:
+                    positions.setdefault(name, position)
+            order = tuple(sorted(range(len(field_datas)), key=lambda position: field_sort_key(field_datas[position])))
+            signature = tuple((field_data.field, field_data.field_def) for field_data in field_datas)
+            layouts[compressed_ts] = (positions, order, signature)
+        return layouts
+
+    @staticmethod
+    def _component_source(raw_value):
+        # Value the components of a field are masked out of, and its size in
+        # bits for byte arrays (unpacked as a little endian number)
+        if isinstance(raw_value, bytes):
+            return int.from_bytes(raw_value, 'little'), len(raw_value) << 3
+        if isinstance(raw_value, tuple):
+            try:
+                return int.from_bytes(bytearray(raw_value), 'little'), len(raw_value) << 3
+            except (TypeError, ValueError):
+                # Not a byte array, keep shifting it in byte steps as before
+                unpacked_num = 0
+                for value in reversed(raw_value):
+                    unpacked_num = (unpacked_num << 8) + value
+                return unpacked_num, len(raw_value) << 3
+        return raw_value, None
+
+    @staticmethod
+    def _unpack_raw_value(def_mesg, data, index):
+        # Unpack a single field of a data message payload
+        field_def = (def_mesg.field_defs + def_mesg.dev_field_defs)[index]
+        base_type = field_def.base_type
+        if field_def.size == base_type.size and base_type.fmt != 's' and base_type.name != 'byte':
+            return base_type.parse(struct.unpack_from(
+                def_mesg.endian + base_type.fmt, data, def_mesg.field_offsets[index])[0])
+        return FitFileDecoder._unpack_raw_values(def_mesg, data)[index]
+
+    @staticmethod
+    def _compile_subfield_plans(mesg_type, field_defs):
+        # For every field with subfields, find the positions of its reference
+        # fields in this definition up front. Each plan is a tuple of
+        # (index, {ref raw_value: (priority, sub_field)}), where priority keeps
+        # the profile's order when more than one subfield matches.
+        plans = {}
+        if not mesg_type:
+            return plans
+        for field in mesg_type.fields.values():
+            if not field.subfields:
+                continue
+            tables = {}
+            priority = 0
+            for sub_field in field.subfields:
+                for ref_field in sub_field.ref_fields:
+                    for n, field_def in enumerate(field_defs):
+                        if field_def.def_num == ref_field.def_num:
+                            tables.setdefault(n, {}).setdefault(ref_field.raw_value, (priority, sub_field))
+                            priority += 1
+            plans[field.def_num] = tuple(tables.items())
+        return plans
+
     @staticmethod
     def _resolve_subfield(field, def_mesg, raw_values):
         # Resolve into (field, parent) ie (subfield, field) or (field, None)
         if field.subfields:
-            for sub_field in field.subfields:
-                # Go through reference fields for this sub field
-                for ref_field in sub_field.ref_fields:
-                    # Go through field defs AND their raw values
-                    for field_def, raw_value in zip(def_mesg.field_defs, raw_values):
-                        # If there's a definition number AND raw value match on the
-                        # reference field, then we return this subfield
-                        if (field_def.def_num == ref_field.def_num) and (ref_field.raw_value == raw_value):
-                            return sub_field, field
+            match = None
+            for index, table in def_mesg.subfield_plans[field.def_num]:
+                candidate = table.get(raw_values[index])
+                if candidate is not None and (match is None or candidate[0] < match[0]):
+                    match = candidate
+            if match is not None:
+                return match[1], field
         return field, None
 
     def _apply_scale_offset(self, field, raw_value):
         # Apply numeric transformations (scale+offset)
-        if isinstance(raw_value, tuple):
+        if isinstance(raw_value, tuple) or (isinstance(raw_value, bytes) and (field.scale or field.offset)):
             # Contains multiple values, apply transformations to all of them
             return tuple(self._apply_scale_offset(field, x) for x in raw_value)
         elif isinstance(raw_value, num_types):
@@ -401,6 +878,12 @@ class FitFileDecoder(DeveloperDataMixin):
                 raw_value = float(raw_value) / field.scale
             if field.offset:
                 raw_value = raw_value - field.offset
+        elif hasattr(raw_value, 'dtype'):
+            # NumPy arrays (numpy_arrays mode) are transformed as a whole
+            if field.scale:
+                raw_value = raw_value / float(field.scale)
+            if field.offset:
+                raw_value = raw_value - field.offset
         return raw_value
 
     @staticmethod
@@ -414,101 +897,415 @@ class FitFileDecoder(DeveloperDataMixin):
 
         return base_value
 
-    def _parse_data_message_components(self, header):
+    def _decode_partial_payload(self, def_mesg, data, fields=None):
+        # Decode the fields read whole of a data message cut short by the end
+        # of the file, one by one. The others are left out (their raw values
+        # are None), as when fields were read one at a time
+        data = bytes(data or b'')
+        field_defs = def_mesg.field_defs + def_mesg.dev_field_defs
+        raw_values = self._unpack_raw_values(def_mesg, data.ljust(def_mesg.data_struct.size, b'\0'))
+        num_read = 0
+        for field_def, offset in zip(field_defs, def_mesg.field_offsets):
+            if offset + field_def.size > len(data):
+                break
+            num_read += 1
+        raw_values[num_read:] = [None] * (len(raw_values) - num_read)
+
+        field_datas = []
+        for field_def, raw_value in zip(field_defs[:num_read], raw_values):
+            self._decode_field(def_mesg, field_def, raw_value, raw_values, field_datas, fields)
+        return raw_values, field_datas
+
+    def _parse_data_message_components(self, header, fields=None):
         def_mesg = self._local_mesgs.get(header.local_mesg_num)
         if not def_mesg:
             raise FitParseError('Got data message with invalid local message type %d' % (
                 header.local_mesg_num))
 
-        raw_values = self._parse_raw_values_from_data_message(def_mesg)
-        field_datas = []  # TODO: I don't love this name, update on DataMessage too
-
-        # TODO: Maybe refactor this and make it simpler (or at least broken
-        #       up into sub-functions)
-        for field_def, raw_value in zip(def_mesg.field_defs + def_mesg.dev_field_defs, raw_values):
-            field, parent_field = field_def.field, None
-            if field:
-                field, parent_field = self._resolve_subfield(field, def_mesg, raw_values)
-
-                # Resolve component fields
-                if field.components:
-                    for component in field.components:
-                        # Render its raw value
-                        try:
-                            cmp_raw_value = component.render(raw_value)
-                        except ValueError:
-                            continue
-
-                        # Apply accumulated value
-                        if component.accumulate and cmp_raw_value is not None:
-                            accumulator = self._accumulators[def_mesg.mesg_num]
-                            cmp_raw_value = self._apply_compressed_accumulation(
-                                cmp_raw_value, accumulator[component.def_num], component.bits,
-                            )
-                            accumulator[component.def_num] = cmp_raw_value
-
-                        # Apply scale and offset from component, not from the dynamic field
-                        # as they may differ
-                        cmp_raw_value = self._apply_scale_offset(component, cmp_raw_value)
-
-                        # Extract the component's dynamic field from def_mesg
-                        cmp_field = def_mesg.mesg_type.fields[component.def_num]
-
-                        # Resolve a possible subfield
-                        cmp_field, cmp_parent_field = self._resolve_subfield(cmp_field, def_mesg, raw_values)
-                        cmp_value = cmp_field.render(cmp_raw_value)
-
-                        # Plop it on field_datas
-                        field_datas.append(
-                            FieldData(
-                                field_def=None,
-                                field=cmp_field,
-                                parent_field=cmp_parent_field,
-                                value=cmp_value,
-                                raw_value=cmp_raw_value,
-                            )
-                        )
-
-                # TODO: Do we care about a base_type and a resolved field mismatch?
-                # My hunch is we don't
-                value = self._apply_scale_offset(field, field.render(raw_value))
-            else:
-                value = raw_value
+        # Read and decode the whole data message at once
+        size = def_mesg.data_struct.size
+        if self._filesize - self._offset < size:
+            # file was suddenly terminated
+            warnings.warn("File was terminated unexpectedly, some data will not be loaded.")
+            data = self._read(self._filesize - self._offset)
+            raw_values, field_datas = self._decode_partial_payload(def_mesg, data, fields)
+        else:
+            raw_values, field_datas = self._decode_payload(def_mesg, self._read(size), fields)
 
-            # Update compressed timestamp field
-            if (field_def.def_num == FIELD_TYPE_TIMESTAMP.def_num) and (raw_value is not None):
+        # Update compressed timestamp field
+        if def_mesg.timestamp_index is not None and raw_values:
+            raw_value = raw_values[def_mesg.timestamp_index]
+            if raw_value is not None:
                 self._compressed_ts_accumulator = raw_value
 
-            field_datas.append(
-                FieldData(
-                    field_def=field_def,
-                    field=field,
-                    parent_field=parent_field,
-                    value=value,
-                    raw_value=raw_value,
-                )
-            )
-
         # Apply timestamp field if we got a header
+        ts_value = None
         if header.time_offset is not None:
             ts_value = self._compressed_ts_accumulator = self._apply_compressed_accumulation(
                 header.time_offset, self._compressed_ts_accumulator, 5,
             )
-            field_datas.append(
-                FieldData(
-                    field_def=None,
-                    field=FIELD_TYPE_TIMESTAMP,
-                    parent_field=None,
-                    value=FIELD_TYPE_TIMESTAMP.render(ts_value),
-                    raw_value=ts_value,
-                )
-            )
 
+        if ts_value is not None:
+            field_data = self._timestamp_field_data(ts_value)
+            if fields is None or self._is_projected(field_data, fields):
+                field_datas.append(field_data)
         return header, def_mesg, field_datas
 
-    def _parse_data_message(self, header):
-        header, def_mesg, field_datas = self._parse_data_message_components(header)
-        return DataMessage(header=header, def_mesg=def_mesg, fields=field_datas)
+    def _decode_payload(self, def_mesg, data, fields=None):
+        # Unpack and decode a data message payload into (raw_values,
+        # field_datas), with the function generated for its definition, or
+        # for only the given fields of it. Developer data is always decoded
+        # whole, as it describes the developer fields.
+        if fields is None or def_mesg.mesg_num in DEV_DATA_MESG_NUMS:
+            return def_mesg.decode_function(self, data)
+        decode_function = def_mesg.projections.get(fields)
+        if decode_function is None:
+            decode_function = def_mesg.projections[fields] = self._compile_projection(def_mesg, fields)
+        return decode_function(self, data)
+
+    @staticmethod
+    def _is_projected(field_data, fields):
+        # Whether field_data.is_named() any of the fields
+        field, parent_field, field_def = field_data.field, field_data.parent_field, field_data.field_def
+        return bool(
+            (field and (field.name in fields or field.def_num in fields))
+            or (parent_field and (parent_field.name in fields or parent_field.def_num in fields))
+            or (field_def and field_def.def_num in fields)
+        )
+
+    @staticmethod
+    def _timestamp_field_data(ts_value):
+        # The timestamp from a compressed timestamp header
+        return FieldData(
+            field_def=None,
+            field=FIELD_TYPE_TIMESTAMP,
+            parent_field=None,
+            value=FIELD_TYPE_TIMESTAMP.render(ts_value),
+            raw_value=ts_value,
+        )
+
+    def _decode_field(self, def_mesg, field_def, raw_value, raw_values, field_datas, fields=None):
+        # Add the FieldData of a field to field_datas, after those of its
+        # components (only the ones named in fields, if given). The generated
+        # decode functions call this for the fields they don't decode
+        # themselves. Only accumulating components touch the decoder state.
+        # TODO: I don't love the name field_datas, update on DataMessage too
+
+        # TODO: Maybe refactor this and make it simpler (or at least broken
+        #       up into sub-functions)
+        field, parent_field = field_def.field, None
+        if field:
+            field, parent_field = self._resolve_subfield(field, def_mesg, raw_values)
+
+            # Resolve component fields
+            if field.components:
+                plan = def_mesg.component_plans.get(field) or self._compile_component_plan(def_mesg, field)
+                # Byte arrays are unpacked once for all of their components
+                cmp_source, num_bits = self._component_source(raw_value)
+                for component, cmp_field, bit_offset, mask, scale, offset in plan:
+                    # Profile.xls sometimes contains more components than the
+                    # byte array is able to hold (typically *event_timestamp_12*)
+                    if num_bits is not None and bit_offset and bit_offset >= num_bits:
+                        continue
+
+                    # Render its raw value
+                    cmp_raw_value = cmp_source
+                    if isinstance(cmp_raw_value, int_types):
+                        cmp_raw_value = (cmp_raw_value >> bit_offset) & mask
+
+                    # Apply accumulated value
+                    if component.accumulate and cmp_raw_value is not None:
+                        accumulator = self._accumulators[def_mesg.mesg_num]
+                        cmp_raw_value = self._apply_compressed_accumulation(
+                            cmp_raw_value, accumulator[component.def_num], component.bits,
+                        )
+                        accumulator[component.def_num] = cmp_raw_value
+
+                    # Apply scale and offset from component, not from the dynamic field
+                    # as they may differ
+                    if isinstance(cmp_raw_value, num_types):
+                        if scale:
+                            cmp_raw_value = float(cmp_raw_value) / scale
+                        if offset:
+                            cmp_raw_value = cmp_raw_value - offset
+
+                    # Resolve a possible subfield of the component's dynamic field
+                    cmp_field, cmp_parent_field = self._resolve_subfield(cmp_field, def_mesg, raw_values)
+                    cmp_value = cmp_field.render(cmp_raw_value)
+
+                    # Plop it on field_datas
+                    field_data = FieldData(
+                        field_def=None,
+                        field=cmp_field,
+                        parent_field=cmp_parent_field,
+                        value=cmp_value,
+                        raw_value=cmp_raw_value,
+                    )
+                    if fields is None or self._is_projected(field_data, fields):
+                        field_datas.append(field_data)
+
+            # TODO: Do we care about a base_type and a resolved field mismatch?
+            # My hunch is we don't
+            value = self._apply_scale_offset(field, field.render(raw_value))
+        else:
+            value = raw_value
+
+        field_data = FieldData(
+            field_def=field_def,
+            field=field,
+            parent_field=parent_field,
+            value=value,
+            raw_value=raw_value,
+        )
+        if fields is None or self._is_projected(field_data, fields):
+            field_datas.append(field_data)
+
+    def _parse_data_message(self, header, fields=None):
+        if self._lazy and fields is None:
+            def_mesg = self._local_mesgs.get(header.local_mesg_num)
+            # Messages that feed decoder state are decoded right away
+            if def_mesg and not def_mesg.accumulates and def_mesg.mesg_num not in DEV_DATA_MESG_NUMS:
+                data, timestamp = self._skip_data_message(header, def_mesg)
+                if header.time_offset is None:
+                    timestamp = None
+                return LazyDataMessage(header, def_mesg, self, data, timestamp)
+
+        header, def_mesg, field_datas = self._parse_data_message_components(header, fields)
+        return self._make_data_message(header, def_mesg, field_datas, fields)
+
+    def _make_data_message(self, header, def_mesg, field_datas, fields):
+        if fields is not None and def_mesg.mesg_num not in DEV_DATA_MESG_NUMS:
+            data_message = ProjectedDataMessage(header=header, def_mesg=def_mesg, fields=field_datas)
+        else:
+            data_message = DataMessage(header=header, def_mesg=def_mesg, fields=field_datas)
+        self._process_data_message(data_message)
+        data_message._check_field_layout()
+        return data_message
+
+    def _parse_messages_in_window(self, names, with_definitions, fields, start, end):
+        # Walk the remaining messages like get_messages(), but only decode the
+        # data messages named in names with a raw timestamp between start and
+        # end (inclusive), stopping at the first one past end. The others are
+        # skipped by size, keeping the decoder state up to date.
+        while True:
+            header = self._next_message_header()
+            if header is None:
+                return
+
+            if header.is_definition:
+                message = self._parse_definition_message(header)
+                if with_definitions and self._should_yield(message, with_definitions, names):
+                    yield message
+                continue
+
+            def_mesg = self._local_mesgs.get(header.local_mesg_num)
+            if def_mesg and def_mesg.mesg_num in DEV_DATA_MESG_NUMS:
+                self._update_dev_data(self._parse_data_message(header))
+                continue
+            if not def_mesg:
+                raise FitParseError('Got data message with invalid local message type %d' % (
+                    header.local_mesg_num))
+
+            data, timestamp = self._skip_data_message(header, def_mesg, accumulate=False)
+            if (names is None or self._is_named(def_mesg, names)) and timestamp is not None:
+                if end is not None and timestamp > end:
+                    return
+                if start is None or timestamp >= start:
+                    yield self._decode_data_payload(header, def_mesg, data, timestamp, fields)
+                    continue
+
+            # Later messages of this type build on the accumulated values
+            if def_mesg.accumulates:
+                self._accumulate_components(def_mesg, self._unpack_raw_values(def_mesg, data))
+
+    def _decode_data_payload(self, header, def_mesg, data, timestamp, fields):
+        # Data message from a payload read by _skip_data_message, whose
+        # accumulated components haven't been applied yet
+        if header.time_offset is None:
+            timestamp = None
+        if self._lazy and fields is None and not def_mesg.accumulates:
+            return LazyDataMessage(header, def_mesg, self, data, timestamp)
+
+        _, field_datas = self._decode_payload(def_mesg, data, fields)
+        if timestamp is not None:
+            field_data = self._timestamp_field_data(timestamp)
+            if fields is None or self._is_projected(field_data, fields):
+                field_datas.append(field_data)
+        return self._make_data_message(header, def_mesg, field_datas, fields)
+
+    def _decode_lazy_message(self, message):
+        # Called by LazyDataMessage on first use of its fields
+        _, field_datas = self._decode_payload(message.def_mesg, message._data)
+        if message._timestamp is not None:
+            field_datas.append(self._timestamp_field_data(message._timestamp))
+        message.fields = field_datas
+        self._process_data_message(message)
+        message._check_field_layout()
+
+    def _process_data_message(self, data_message):
+        # Hook for running data processors on a decoded message
+        pass
+
+    def _iter_data_payloads(self, names, start=None, end=None):
+        # Walk the remaining messages like _parse_message, but hand out only the
+        # raw payload (and raw timestamp) of the data messages named in names.
+        # Definitions and developer data are still parsed to keep state correct.
+        # Given start and/or end, it stops at the first payload past end and
+        # leaves out the ones outside of the window, except those of
+        # accumulating definitions, which later payloads build on, and the
+        # first of every definition, which makes its fields known.
+        windowed = start is not None or end is not None
+        seen = set()
+        while True:
+            header = self._next_message_header()
+            if header is None:
+                return
+
+            if header.is_definition:
+                self._parse_definition_message(header)
+                continue
+
+            def_mesg = self._local_mesgs.get(header.local_mesg_num)
+            if not def_mesg:
+                raise FitParseError('Got data message with invalid local message type %d' % (
+                    header.local_mesg_num))
+
+            # Nothing decoded from these payloads reads the accumulators
+            data, timestamp = self._skip_data_message(header, def_mesg, accumulate=False)
+            if def_mesg.mesg_num in DEV_DATA_MESG_NUMS:
+                # Developer data is registered as it's read, and handed out
+                # like any other payload when asked for
+                _, field_datas = self._decode_payload(def_mesg, data)
+                self._update_dev_data(DataMessage(header=header, def_mesg=def_mesg, fields=field_datas))
+            if not self._is_named(def_mesg, names):
+                continue
+            if not windowed:
+                yield def_mesg, data, timestamp
+                continue
+            if end is not None and timestamp is not None and timestamp > end:
+                return
+            if def_mesg.accumulates or def_mesg not in seen or self._in_window(timestamp, start, end):
+                seen.add(def_mesg)
+                yield def_mesg, data, timestamp
+
+    def _copy_decoder(self, decoder_class=None, **kwargs):
+        # Fresh decoder over the same data (sharing the buffer when there is
+        # one), for passes that mustn't disturb this decoder's own state
+        kwargs.setdefault('numpy_arrays', self._numpy_arrays)
+        return (decoder_class or FitFileDecoder)(
+            self._buffer if self._buffer is not None else self._fileish,
+            buffered=True,
+            check_developer_data=self.check_developer_data,
+            **kwargs
+        )
+
+    def _index_messages(self, checkpoint_interval):
+        index = MessageIndex(*MessageIndex.fingerprint(self._buffer), checkpoint_interval=checkpoint_interval)
+        def_offsets = {}
+        while True:
+            while self._bytes_left <= 0:
+                if self._finish_segment():
+                    return index
+                # The definitions of a chained file don't carry over to the next
+                def_offsets = {}
+
+            offset, bytes_left = self._offset, self._bytes_left
+            header = self._parse_message_header()
+            if header.is_definition:
+                def_mesg = self._parse_definition_message(header)
+                def_offsets[header.local_mesg_num] = offset
+                index.mesg_names[def_mesg.mesg_num] = def_mesg.name
+                continue
+
+            def_mesg = self._local_mesgs.get(header.local_mesg_num)
+            if not def_mesg:
+                raise FitParseError('Got data message with invalid local message type %d' % (
+                    header.local_mesg_num))
+
+            # The header was all that has been read of this message
+            if len(index.offsets) % checkpoint_interval == 0:
+                index.checkpoints.append(Checkpoint(
+                    position=len(index.offsets),
+                    offset=offset,
+                    bytes_left=bytes_left,
+                    segment_start=self._crc_start,
+                    definitions=dict(def_offsets),
+                    accumulators=dict((mesg_num, dict(acc)) for mesg_num, acc in self._accumulators.items()),
+                    compressed_ts=self._compressed_ts_accumulator,
+                    num_dev_data=len(index.dev_data),
+                ))
+
+            if def_mesg.mesg_num in DEV_DATA_MESG_NUMS:
+                self._update_dev_data(self._parse_data_message(header))
+                index.dev_data.append((def_offsets[header.local_mesg_num], offset))
+                timestamp = None
+            else:
+                _, timestamp = self._skip_data_message(header, def_mesg)
+
+            index.offsets.append(offset)
+            index.mesg_nums.append(def_mesg.mesg_num)
+            index.timestamps.append(timestamp)
+
+    def _parse_message_at(self, offset):
+        # Parse the single message at offset (within the current segment)
+        self._offset = offset
+        self._bytes_left = self._filesize - offset
+        header = self._parse_message_header()
+        if header.is_definition:
+            return self._parse_definition_message(header)
+        message = self._parse_data_message(header)
+        self._update_dev_data(message)
+        return message
+
+    def _restore_checkpoint(self, index, checkpoint):
+        # Replay the developer data seen so far, then the active definitions
+        self.dev_types = {}
+        for def_offset, offset in index.dev_data[:checkpoint.num_dev_data]:
+            self._parse_message_at(def_offset)
+            self._parse_message_at(offset)
+
+        self._local_mesgs = {}
+        for def_offset in checkpoint.definitions.values():
+            self._parse_message_at(def_offset)
+
+        # Parsing definitions resets accumulators, so restore them after
+        self._accumulators = dict((mesg_num, dict(acc)) for mesg_num, acc in checkpoint.accumulators.items())
+        self._compressed_ts_accumulator = checkpoint.compressed_ts
+        self._offset = checkpoint.offset
+        self._bytes_left = checkpoint.bytes_left
+        # Where the chained file the checkpoint is in starts, for its CRC
+        self._crc_start = checkpoint.segment_start
+        self._complete = False
+
+    def _decode_positions(self, index, positions, fields=None):
+        # Decode the data messages at the given (sorted) index positions,
+        # jumping to the nearest checkpoint whenever that skips messages
+        position = None
+        for target in positions:
+            checkpoint = index.checkpoint_for(target)
+            if position is None or checkpoint.position > position:
+                self._restore_checkpoint(index, checkpoint)
+                position = checkpoint.position
+
+            while True:
+                header = self._next_message_header()
+                if header is None:
+                    raise FitParseError('Message index points past the end of the file')
+                if header.is_definition:
+                    self._parse_definition_message(header)
+                    continue
+
+                position += 1
+                def_mesg = self._local_mesgs.get(header.local_mesg_num)
+                if position - 1 == target:
+                    message = self._parse_data_message(header, fields)
+                    self._update_dev_data(message)
+                    yield message
+                    break
+                if def_mesg and def_mesg.mesg_num not in DEV_DATA_MESG_NUMS:
+                    self._skip_data_message(header, def_mesg)
+                else:
+                    self._update_dev_data(self._parse_data_message(header))
 
     @staticmethod
     def _should_yield(message, with_definitions, names):
@@ -522,6 +1319,10 @@ class FitFileDecoder(DeveloperDataMixin):
                 return True
         return False
 
+    @staticmethod
+    def _is_named(def_mesg, names):
+        return (def_mesg.name in names) or (def_mesg.mesg_num in names)
+
     @staticmethod
     def _make_set(obj):
         if obj is None:
@@ -532,48 +1333,489 @@ class FitFileDecoder(DeveloperDataMixin):
         else:
             return set((obj,))
 
+    @staticmethod
+    def _make_timestamp(value):
+        # Raw FIT timestamp of a datetime or Unix epoch, None for no limit
+        return fit_timestamp(value) if value is not None else None
+
+    @staticmethod
+    def _in_window(timestamp, start, end):
+        return timestamp is not None and (start is None or timestamp >= start) and (end is None or timestamp <= end)
+
+    @classmethod
+    def _make_fields(cls, fields):
+        # Fields to decode, as the key of the definitions' projections
+        fields = cls._make_set(fields)
+        return frozenset(fields) if fields is not None else None
+
     ##########
     # Public API
 
-    def get_messages(self, name=None, with_definitions=False, as_dict=False):
+    def get_messages(self, name=None, with_definitions=False, as_dict=False, fields=None, start=None, end=None):
+        """Parse and yield the messages of the file.
+
+        :param name: message name(s) or number(s), None for all of them
+        :param with_definitions: yield definition messages too
+        :param as_dict: yield dicts instead of message objects
+        :param fields: field name(s) or number(s) to decode, None for all of
+                       them. The other fields are skipped over rather than
+                       decoded, and data processors only see these.
+                       Developer data messages are always decoded whole.
+        :param start: only data messages with a timestamp at or after this
+                      datetime (naive ones are UTC) or Unix epoch. Messages
+                      without a timestamp are left out when given a window.
+        :param end: only data messages with a timestamp at or before this.
+                    Parsing stops at the first message asked for past end,
+                    so the ones asked for are expected in time order (as
+                    records are)
+        """
         if with_definitions:  # with_definitions implies as_dict=False
             as_dict = False
 
         names = self._make_set(name)
+        fields = self._make_fields(fields)
+
+        if start is not None or end is not None:
+            for message in self._parse_messages_in_window(
+                    names, with_definitions, fields, self._make_timestamp(start), self._make_timestamp(end)):
+                yield message.as_dict() if as_dict else message
+            return
+        # Other data messages can be skipped when only some types are wanted
+        skip_unnamed = names is not None and not with_definitions
 
         while not self._complete:
-            message = self._parse_message()
+            if skip_unnamed:
+                message = self._parse_named_message(names, fields)
+            else:
+                message = self._parse_message(fields)
             if self._should_yield(message, with_definitions, names):
                 yield message.as_dict() if as_dict else message
 
+    def get_columns(self, name, fields=None, start=None, end=None):
+        """Decode one message type into a NumPy array per field.
+
+        This makes its own pass over the whole file and never creates message
+        objects. Scale and offset are applied and semicircles are converted to
+        degrees; data processors are not run and subfields are not resolved.
+        Fields that only come from components of other fields (such as speed
+        and distance in compressed_speed_distance) are expanded and
+        accumulated, with one column per component when there are several.
+
+        :param name: message name or global message number, e.g. 'record'
+        :param fields: field names (or numbers) to decode, None for all of them
+        :param start: only rows with a timestamp at or after this datetime
+                      (naive ones are UTC) or Unix epoch
+        :param end: only rows with a timestamp at or before this. Decoding
+                    stops at the first message past end
+        :return: dict of field name to numpy.ma.MaskedArray, where masked
+                 entries hold the FIT invalid value. timestamp and other
+                 date_time fields are datetime64[s] in UTC, except for
+                 ones holding only seconds relative to the device's power
+                 up, which are left as numbers
+        :rtype: dict
+        """
+        # Imported here so NumPy is only loaded when columns are asked for
+        from fitparse.columns import build_columns
+
+        # Decode from the start of the file with a fresh state
+        decoder = self._copy_decoder(FitFileDecoder, check_crc=self.check_crc)
+        try:
+            start, end = self._make_timestamp(start), self._make_timestamp(end)
+            payloads = decoder._iter_data_payloads(self._make_set(name), start, end)
+            return build_columns(payloads, fields, start, end)
+        finally:
+            decoder.close()
+
+    def iter_rows(self, name, fields, named=False, start=None, end=None):
+        """Decode data messages into plain tuples of field values.
+
+        This makes its own pass over the whole file, like get_columns(), but
+        needs no NumPy. Values are rendered and scaled, and processed like
+        FitFileDataProcessor(epoch_timestamps=True) does whatever the data
+        processor is, so timestamps are Unix epochs. Fields (components
+        included) of definitions that decode the same way for every message
+        are read straight from the payload without creating FieldData
+        objects; subfields and accumulated values go through regular
+        decoding. The rows suit DB-API executemany().
+
+        :param name: message name(s) or number(s), e.g. 'record'
+        :param fields: field names (or numbers), in the order of the values
+                       of each row. Missing fields are None
+        :param named: yield a namedtuple per message type (named after it)
+                      instead of plain tuples
+        :param start: only rows with a timestamp at or after this datetime
+                      (naive ones are UTC) or Unix epoch
+        :param end: only rows with a timestamp at or before this. Decoding
+                    stops at the first message past end
+        """
+        fields = tuple(fields)
+        start, end = self._make_timestamp(start), self._make_timestamp(end)
+        windowed = start is not None or end is not None
+        row_types = {}
+
+        # Decode from the start of the file with a fresh state
+        decoder = self._copy_decoder(FitFileDecoder, check_crc=self.check_crc)
+        try:
+            for def_mesg, data, timestamp in decoder._iter_data_payloads(self._make_set(name), start, end):
+                row_function = def_mesg.row_functions.get(fields)
+                if row_function is None:
+                    row_function = def_mesg.row_functions[fields] = decoder._compile_row_function(def_mesg, fields)
+                if windowed and not self._in_window(timestamp, start, end):
+                    if def_mesg.accumulates:
+                        # Only decoded for the values later rows build on
+                        row_function(decoder, data, timestamp)
+                    continue
+
+                row = row_function(decoder, data, timestamp)
+                if named:
+                    row_type = row_types.get(def_mesg.name)
+                    if row_type is None:
+                        row_type = row_types[def_mesg.name] = namedtuple(
+                            def_mesg.name, [str(field) for field in fields], rename=True,
+                        )
+                    row = row_type._make(row)
+                yield row
+        finally:
+            decoder.close()
+
+    def build_index(self, checkpoint_interval=CHECKPOINT_INTERVAL):
+        """Index the byte offset, message number and timestamp of every data message.
+
+        This makes its own pass over the whole file, skipping data messages
+        by size. Every checkpoint_interval messages the decoder state is
+        recorded, so get_messages_by_index() can start decoding from there.
+
+        :param checkpoint_interval: number of data messages between checkpoints
+        :rtype: fitparse.index.MessageIndex
+        """
+        decoder = self._copy_decoder(FitFileDecoder, check_crc=self.check_crc)
+        try:
+            return decoder._index_messages(checkpoint_interval)
+        finally:
+            decoder.close()
+
+    def get_messages_by_index(self, index, name=None, start=None, end=None, as_dict=False, fields=None):
+        """Decode only the data messages picked out by a MessageIndex.
+
+        Decoding starts from the checkpoint closest before each message, so
+        for example the session messages at the end of a file are found
+        without decoding the records before them.
+
+        :param index: MessageIndex built for this file (checked against it)
+        :param name: message name(s) or number(s), None for all of them
+        :param start: only messages with a timestamp at or after this
+                      datetime (naive ones are UTC) or Unix epoch
+        :param end: only messages with a timestamp at or before this
+        :param as_dict: yield dicts instead of DataMessage objects
+        :param fields: field name(s) or number(s) to decode, as for get_messages()
+        """
+        decoder = self._copy_decoder(lazy=self._lazy)
+        try:
+            index.check(decoder._buffer)
+            positions = index.find(self._make_set(name), self._make_timestamp(start), self._make_timestamp(end))
+            for message in decoder._decode_positions(index, positions, self._make_fields(fields)):
+                yield message.as_dict() if as_dict else message
+        finally:
+            decoder.close()
+
+    def get_messages_parallel(self, name=None, workers=None, index=None, chunk_size=None, fields=None):
+        """Decode data messages in worker processes, for large files.
+
+        The file is split at the checkpoints of a MessageIndex (built first
+        unless one is given), which hold everything needed to start decoding
+        midway, so chunks of it are decoded side by side. Chained FIT files
+        split the same way. Messages come back in file order, as dicts.
+
+        :param name: message name(s) or number(s), None for all of them
+        :param workers: number of worker processes, None for one per CPU
+        :param index: MessageIndex built for this file (checked against it)
+        :param chunk_size: least number of bytes of the file per chunk, None
+                           to give each worker a few chunks
+        :param fields: field name(s) or number(s) to decode, as for get_messages()
+        """
+        # Imported here so the process pool machinery is only loaded when used
+        from fitparse.parallel import CHUNKS_PER_WORKER, MIN_CHUNK_SIZE, decode_chunks, split_chunks
+
+        if index is None:
+            index = self.build_index()
+        decoder = self._copy_decoder(FitFileDecoder)
+        try:
+            index.check(decoder._buffer)
+            # Workers open paths themselves, anything else is sent as bytes
+            if isinstance(self._fileish, str):
+                source = self._fileish
+            else:
+                source = decoder._buffer.tobytes()
+        finally:
+            decoder.close()
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(MIN_CHUNK_SIZE, index.size // (workers * CHUNKS_PER_WORKER))
+
+        chunks = split_chunks(index, index.find(self._make_set(name)), chunk_size)
+        decoder_class, decoder_kwargs = self._worker_decoder_args()
+        return decode_chunks(source, index, chunks, decoder_class, decoder_kwargs, workers, self._make_fields(fields))
+
+    def _worker_decoder_args(self):
+        # Decoder class and arguments for decoding in another process
+        return FitFileDecoder, {
+            'check_developer_data': self.check_developer_data,
+            'numpy_arrays': self._numpy_arrays,
+        }
+
     def __iter__(self):
         return self.get_messages()
 
 
+class CachePolicy(object):
+    """Which parsed messages a FitFile keeps, the default being all of them.
+
+    Messages that aren't kept, or were dropped to stay within max_messages
+    or max_bytes, are decoded again when asked for later. That replay uses
+    the FitFile's message index when it has one.
+
+    :param names: message names or numbers to keep, None for all types. Ask
+                  for them the same way to get them from the cache
+    :param definitions: whether to keep definition messages
+    :param max_messages: most messages to keep, dropping the oldest first
+    :param max_bytes: most bytes of messages to keep (counted as their size
+                      in the FIT file), dropping the oldest first
+    """
+
+    def __init__(self, names=None, definitions=True, max_messages=None, max_bytes=None):
+        self.names = set(names) if names is not None else None
+        self.definitions = definitions
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+
+    def keeps(self, message):
+        if self.max_messages == 0 or self.max_bytes == 0:
+            return False
+        if message.type == 'definition':
+            return self.definitions
+        return self.names is None or message.name in self.names or message.mesg_num in self.names
+
+    def covers(self, names, with_definitions):
+        # Whether everything asked for is kept (unless dropped for size)
+        if with_definitions and not self.definitions:
+            return False
+        if self.max_messages == 0 or self.max_bytes == 0:
+            return False
+        return self.names is None or (names is not None and names <= self.names)
+
+    def is_full(self, num_messages, num_bytes):
+        return (
+            (self.max_messages is not None and num_messages > self.max_messages)
+            or (self.max_bytes is not None and num_bytes > self.max_bytes)
+        )
+
+
 class CacheMixin(object):
     """Add message caching to the FitFileDecoder"""
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, cache_policy=None, index=None, **kwargs):
         super(CacheMixin, self).__init__(*args, **kwargs)
+        self._cache_policy = cache_policy or CachePolicy()
+        # MessageIndex to replay uncached data messages from, or True to
+        # build one when it's first needed
+        self._index = index
+
         self._messages = []
+        # Number in file order (definitions included) and size in the file
+        # of each cached message
+        self._message_seqs = []
+        self._message_sizes = []
+        self._cached_bytes = 0
+        # Messages numbered below this may have been dropped from the cache
+        self._evicted = 0
+        # Positions in _messages of the data messages of each type,
+        # keyed by both message name and global message number
+        self._message_index = {}
+
+        # Messages, and data messages, parsed so far
+        self._num_parsed = 0
+        self._num_parsed_data = 0
+        self._message_start = None
+
+    def _next_message_header(self):
+        header = super(CacheMixin, self)._next_message_header()
+        if header is not None:
+            self._num_parsed += 1
+            if not header.is_definition:
+                self._num_parsed_data += 1
+            # Message headers are a single byte
+            self._message_start = self._offset - 1
+        return header
 
     def _parse_message(self):
-        self._messages.append(super(CacheMixin, self)._parse_message())
-        return self._messages[-1]
+        message = super(CacheMixin, self)._parse_message()
+        if message is not None:
+            self._cache_message(message)
+        return message
+
+    def _parse_named_message(self, names):
+        # Skipping would leave holes in a cache of all types, so only skip
+        # messages the cache doesn't keep anyway
+        if self._cache_policy.names is None:
+            return self._parse_message()
+        message = super(CacheMixin, self)._parse_named_message(names | self._cache_policy.names)
+        if message is not None:
+            self._cache_message(message)
+        return message
+
+    def _cache_message(self, message):
+        policy = self._cache_policy
+        if not policy.keeps(message):
+            return
+
+        size = self._offset - self._message_start
+        self._messages.append(message)
+        self._message_seqs.append(self._num_parsed - 1)
+        self._message_sizes.append(size)
+        self._cached_bytes += size
+        if message.type == 'data':
+            self._add_to_message_index(message, len(self._messages) - 1)
+
+        if policy.is_full(len(self._messages), self._cached_bytes):
+            self._evict()
+
+    def _add_to_message_index(self, message, position):
+        positions = self._message_index.get(message.mesg_num)
+        if positions is None:
+            positions = self._message_index[message.mesg_num] = self._message_index[message.name] = []
+        positions.append(position)
+
+    def _evict(self):
+        # Drop the oldest messages down to three quarters of the limits, so
+        # this happens in batches
+        policy = self._cache_policy
+        max_messages = policy.max_messages * 3 // 4 if policy.max_messages is not None else None
+        max_bytes = policy.max_bytes * 3 // 4 if policy.max_bytes is not None else None
+        num_messages, num_bytes = len(self._messages), self._cached_bytes
+        n = 0
+        while n < num_messages and (
+            (max_messages is not None and num_messages - n > max_messages)
+            or (max_bytes is not None and num_bytes > max_bytes)
+        ):
+            num_bytes -= self._message_sizes[n]
+            n += 1
+
+        self._evicted = self._message_seqs[n - 1] + 1
+        del self._messages[:n]
+        del self._message_seqs[:n]
+        del self._message_sizes[:n]
+        self._cached_bytes = num_bytes
+
+        self._message_index = {}
+        for position, message in enumerate(self._messages):
+            if message.type == 'data':
+                self._add_to_message_index(message, position)
+
+    def get_messages(self, name=None, with_definitions=False, as_dict=False, fields=None, start=None, end=None):
+        windowed = start is not None or end is not None
+        if windowed and self._index is not None and not with_definitions:
+            # Straight to the messages in the window
+            if self._index is True:
+                self._index = self.build_index()
+            for message in self.get_messages_by_index(self._index, name, start, end, as_dict, fields):
+                yield message
+            return
+
+        if fields is not None or windowed:
+            # Messages missing fields, or only those in a time window, aren't
+            # cached, so these are decoded in a pass of their own
+            decoder = self._copy_decoder(check_crc=self.check_crc)
+            try:
+                for message in decoder.get_messages(name, with_definitions, as_dict, fields, start, end):
+                    yield message
+            finally:
+                decoder.close()
+            return
 
-    def get_messages(self, name=None, with_definitions=False, as_dict=False):
         if with_definitions:  # with_definitions implies as_dict=False
             as_dict = False
 
         names = self._make_set(name)
-
-        # Yield all parsed messages first
-        for message in self._messages:
+        skip_unnamed = names is not None and not with_definitions
+
+        # Number of the next message (and data message) to yield
+        seq = position = 0
+        while True:
+            # Messages parsed before, or meanwhile through another iterator
+            if seq < self._num_parsed:
+                num_parsed, num_parsed_data = self._num_parsed, self._num_parsed_data
+                for message in self._get_parsed_messages(
+                        names, with_definitions, seq, position, num_parsed, num_parsed_data):
+                    yield message.as_dict() if as_dict else message
+                seq, position = num_parsed, num_parsed_data
+                continue
+
+            if self._complete:
+                return
+
+            if skip_unnamed:
+                message = self._parse_named_message(names)
+            else:
+                message = self._parse_message()
+            seq, position = self._num_parsed, self._num_parsed_data
             if self._should_yield(message, with_definitions, names):
                 yield message.as_dict() if as_dict else message
 
-        for message in super(CacheMixin, self).get_messages(names, with_definitions, as_dict):
-            yield message
+    def _get_parsed_messages(self, names, with_definitions, seq, position, num_parsed, num_parsed_data):
+        # Already parsed messages numbered from seq (and data messages from
+        # position) up to num_parsed, from the cache if it has all of them
+        if seq >= self._evicted and self._cache_policy.covers(names, with_definitions):
+            start = bisect.bisect_left(self._message_seqs, seq)
+            stop = bisect.bisect_left(self._message_seqs, num_parsed)
+            if names is None or with_definitions:
+                messages = self._messages[start:stop]
+            else:
+                messages = [self._messages[n] for n in self._get_indexed_positions(names) if start <= n < stop]
+            for message in messages:
+                if self._should_yield(message, with_definitions, names):
+                    yield message
+            return
+
+        if not with_definitions and self._index is not None:
+            if self._index is True:
+                self._index = self.build_index()
+            positions = [n for n in self._index.find(names) if position <= n < num_parsed_data]
+            decoder = self._copy_decoder(lazy=self._lazy)
+            try:
+                self._index.check(decoder._buffer)
+                for message in decoder._decode_positions(self._index, positions):
+                    yield message
+            finally:
+                decoder.close()
+            return
+
+        # Decode the file again up to where this decoder is
+        decoder = self._copy_decoder(lazy=self._lazy)
+        try:
+            for n in range(num_parsed):
+                if names is not None and not with_definitions:
+                    message = decoder._parse_named_message(names)
+                else:
+                    message = decoder._parse_message()
+                if n >= seq and self._should_yield(message, with_definitions, names):
+                    yield message
+        finally:
+            decoder.close()
+
+    def _get_indexed_positions(self, names):
+        # Positions of cached data messages of the given types, in file order
+        position_lists = []
+        for name in names:
+            positions = self._message_index.get(name)
+            # A type may be asked for by both name and number
+            if positions is not None and not any(positions is other for other in position_lists):
+                position_lists.append(positions)
+
+        if len(position_lists) == 1:
+            return position_lists[0]
+        return heapq.merge(*position_lists)
 
     @property
     def messages(self):
@@ -589,22 +1831,53 @@ class DataProcessorMixin(object):
 
     def __init__(self, *args, **kwargs):
         self._processor = kwargs.pop("data_processor", None) or FitFileDataProcessor()
+        # Processors resolved per field (or field definition for unknown
+        # fields), per units and per message name
+        self._field_processors = {}
+        self._unit_processors = {}
+        self._message_processors = {}
         super(DataProcessorMixin, self).__init__(*args, **kwargs)
 
-    def _parse_data_message(self, header):
-        header, def_mesg, field_datas = self._parse_data_message_components(header)
-
-        # Apply data processors
-        for field_data in field_datas:
-            # Apply type name processor
-            self._processor.run_type_processor(field_data)
-            self._processor.run_field_processor(field_data)
-            self._processor.run_unit_processor(field_data)
-
-        data_message = DataMessage(header=header, def_mesg=def_mesg, fields=field_datas)
-        self._processor.run_message_processor(data_message)
-
-        return data_message
+    def _copy_decoder(self, decoder_class=None, **kwargs):
+        # Copies decode to processed messages the same way
+        if decoder_class is None:
+            decoder_class = UncachedFitFile
+            kwargs.setdefault('data_processor', self._processor)
+        return super(DataProcessorMixin, self)._copy_decoder(decoder_class, **kwargs)
+
+    def _worker_decoder_args(self):
+        decoder_class, decoder_kwargs = super(DataProcessorMixin, self)._worker_decoder_args()
+        decoder_kwargs['data_processor'] = self._processor
+        return UncachedFitFile, decoder_kwargs
+
+    def _process_data_message(self, data_message):
+        # Apply data processors: type and field processors, then the one for the
+        # units they leave behind
+        for field_data in data_message.fields:
+            key = field_data.field or field_data.field_def
+            processors = self._field_processors.get(key)
+            if processors is None:
+                processors = self._field_processors[key] = self._processor.resolve_field_processors(field_data)
+            for processor in processors:
+                processor(field_data)
+
+            units = field_data.units
+            if units:
+                if units in self._unit_processors:
+                    processor = self._unit_processors[units]
+                else:
+                    processor = self._unit_processors[units] = self._processor.resolve_unit_processor(units)
+                if processor is not None:
+                    processor(field_data)
+
+        name = data_message.def_mesg.name
+        if name in self._message_processors:
+            processor = self._message_processors[name]
+        else:
+            processor = self._message_processors[name] = self._processor.resolve_message_processor(
+                data_message.def_mesg)
+        if processor is not None:
+            processor(data_message)
 
 
 class UncachedFitFile(DataProcessorMixin, FitFileDecoder):
@@ -0,0 +1,266 @@
+"""Generate specialized decode functions for data message definitions"""
+
+from fitparse.processors import EPOCH_TYPE_CONVERTERS
+from fitparse.records import BASE_TYPES, FieldData
+
+
+def field_names(def_mesg, field_def):
+    """Names and numbers the FieldData decoded from a field definition may
+    be asked for by (see FieldData.is_named), subfields and components
+    included"""
+    names = set([field_def.def_num])
+    field = field_def.field
+    if field is None:
+        return names
+    for field_or_subfield in (field,) + tuple(field.subfields or ()):
+        names.update((field_or_subfield.name, field_or_subfield.def_num))
+        for component in field_or_subfield.components or ():
+            cmp_field = def_mesg.mesg_type.fields.get(component.def_num) if def_mesg.mesg_type else None
+            if cmp_field is None:
+                continue
+            for cmp_field_or_subfield in (cmp_field,) + tuple(cmp_field.subfields or ()):
+                names.update((cmp_field_or_subfield.name, cmp_field_or_subfield.def_num))
+    return names
+
+
+def accumulates(field):
+    """Whether decoding the field updates accumulated component values"""
+    return field is not None and any(
+        component.accumulate
+        for field_or_subfield in (field,) + tuple(field.subfields or ())
+        for component in field_or_subfield.components or ()
+    )
+
+
+def compile_decode_function(def_mesg, fields=None, data_struct=None, value_slices=None):
+    """Generate and compile the decode function of a definition message
+
+    The function takes the decoder and a data message payload and returns
+    (raw_values, field_datas), like FitFileDecoder._unpack_raw_values
+    followed by FitFileDecoder._decode_field for every field. Plain scalar
+    fields are unpacked, scrubbed, rendered and scaled in straight-line
+    code; the rest (subfields, components, arrays, strings and byte arrays)
+    call _decode_field.
+
+    Given fields (a set of field names and numbers), only the FieldData
+    named in it are made. data_struct and value_slices then stand in for
+    those of the definition, leaving out (with an empty slice) the values
+    that don't need unpacking, whose raw values are None.
+    """
+    field_defs = def_mesg.field_defs + def_mesg.dev_field_defs
+    if data_struct is None:
+        data_struct, value_slices = def_mesg.data_struct, def_mesg.value_slices
+    namespace = {
+        'FieldData': FieldData,
+        'def_mesg': def_mesg,
+        'fields': fields,
+        'unpack': data_struct.unpack,
+    }
+    lines = [
+        'def decode(decoder, data):',
+        '    v = unpack(data) if data else ()',
+    ]
+
+    # Raw values
+    lines += _raw_value_lines(def_mesg, field_defs, value_slices, namespace)
+    lines.append('    raw_values = [%s]' % ''.join('r%d, ' % n for n in range(len(field_defs))))
+
+    # Fields
+    lines.append('    field_datas = []')
+    for n, (field_def, (start, stop)) in enumerate(zip(field_defs, def_mesg.value_slices)):
+        namespace['field_def_%d' % n] = field_def
+        field = field_def.field
+        if fields is not None and not (field_names(def_mesg, field_def) & fields or accumulates(field)):
+            continue
+        base_type = field_def.base_type
+        is_scalar = stop - start == 1 and base_type.fmt != 's' and base_type.name != 'byte'
+        if field is not None and (
+                field.subfields or field.components or not is_scalar
+                or (field.type.values and (field.scale or field.offset))):
+            # Fields and components named differently from message to message
+            # are picked out as they are decoded
+            lines.append('    decoder._decode_field(def_mesg, field_def_%d, r%d, raw_values, field_datas%s)' % (
+                n, n, ', fields' if fields is not None and (field.subfields or field.components) else '',
+            ))
+            continue
+
+        if field is not None:
+            namespace['field_%d' % n] = field
+        value = _value_expression(n, field, namespace)
+        lines.append(
+            # Positional arguments: field_def, field, parent_field, value, raw_value
+            '    field_datas.append(FieldData(field_def_%d, %s, None, %s, r%d))'
+            % (n, 'field_%d' % n if field is not None else 'None', value, n)
+        )
+    lines.append('    return raw_values, field_datas')
+
+    source = '\n'.join(lines) + '\n'
+    code = compile(source, '<fitparse decode %s>' % def_mesg.name, 'exec')
+    exec(code, namespace)
+    return namespace['decode']
+
+
+def compile_row_function(def_mesg, fields, data_struct, value_slices):
+    """Generate and compile the row function of a definition message, for
+    FitFileDecoder.iter_rows()
+
+    The function takes the decoder, a data message payload and its raw
+    timestamp and returns the tuple of the values of fields (names or
+    numbers, in order) that DataMessage.get_value() would give after a
+    FitFileDataProcessor with epoch_timestamps. The values are worked out
+    straight from the unpacked payload, with data_struct and value_slices
+    as for compile_decode_function().
+
+    Returns None unless every data message of the definition decodes to the
+    same fields, with nothing accumulated. Components are shifted and masked
+    out of the raw value of their field.
+    """
+    field_layouts = def_mesg.field_layouts
+    if not field_layouts or def_mesg.accumulates:
+        return None
+    field_defs = def_mesg.field_defs + def_mesg.dev_field_defs
+    positions, order, _ = field_layouts[False]
+    num_fields = len(order)
+    # A compressed timestamp header adds a timestamp field at the end
+    timestamp_positions = field_layouts[True][0]
+
+    # (field number, component plan entry) of the fields of the layout, in
+    # order. The components of a field come before it
+    layout_fields = []
+    for n, field_def in enumerate(field_defs):
+        field = field_def.field
+        if field is not None and field.components:
+            layout_fields += [(n, cmp_plan) for cmp_plan in def_mesg.component_plans[field]]
+        layout_fields.append((n, None))
+
+    namespace = {
+        'unpack': data_struct.unpack,
+        'convert_timestamp': EPOCH_TYPE_CONVERTERS['date_time'],
+    }
+    values = []
+    component_lines = {}
+    for name in fields:
+        position = positions.get(name)
+        if position is None:
+            values.append('convert_timestamp(timestamp)' if timestamp_positions.get(name) == num_fields else 'None')
+            continue
+        n, cmp_plan = layout_fields[position]
+
+        field_def = field_defs[n]
+        field = field_def.field
+        start, stop = def_mesg.value_slices[n]
+        base_type = field_def.base_type
+        if cmp_plan is not None:
+            value, value_lines = _component_lines(n, cmp_plan, namespace)
+            component_lines.setdefault(n, {})[value] = value_lines
+            values.append(value)
+            continue
+        if field is None:
+            values.append('r%d' % n)
+            continue
+        namespace['field_%d' % n] = field
+        if (stop - start == 1 and base_type.fmt != 's' and base_type.name != 'byte'
+                and not (field.type.values and (field.scale or field.offset))):
+            value = _value_expression(n, field, namespace)
+        else:
+            value = 'decoder._apply_scale_offset(field_%d, field_%d.render(r%d))' % (n, n, n)
+        converter = EPOCH_TYPE_CONVERTERS.get(field.type.name)
+        if converter is not None:
+            namespace['convert_%d' % n] = converter
+            value = 'convert_%d(%s)' % (n, value)
+        values.append(value)
+
+    lines = [
+        'def row(decoder, data, timestamp):',
+        '    v = unpack(data) if data else ()',
+    ]
+    lines += _raw_value_lines(def_mesg, field_defs, value_slices, namespace)
+    for n, lines_by_value in sorted(component_lines.items()):
+        # Value the components are masked out of (see _component_source)
+        start, stop = def_mesg.value_slices[n]
+        base_type = field_defs[n].base_type
+        if stop - start == 1 and base_type.fmt != 's' and base_type.name != 'byte':
+            lines.append('    c%d = r%d' % (n, n))
+        else:
+            lines.append('    c%d = decoder._component_source(r%d)[0]' % (n, n))
+        for value_lines in lines_by_value.values():
+            lines += value_lines
+    lines.append('    return (%s)' % ''.join('%s, ' % value for value in values))
+
+    source = '\n'.join(lines) + '\n'
+    code = compile(source, '<fitparse row %s>' % def_mesg.name, 'exec')
+    exec(code, namespace)
+    return namespace['row']
+
+
+def _raw_value_lines(def_mesg, field_defs, value_slices, namespace):
+    # Lines setting r0, r1, ... to the raw values of the fields, unpacked
+    # into v, scrubbed of invalid values
+    lines = []
+    for n, (field_def, (start, stop)) in enumerate(zip(field_defs, value_slices)):
+        base_type = field_def.base_type
+        namespace['parse_%d' % n] = base_type.parse
+        if start == stop:
+            lines.append('    r%d = None' % n)
+        elif stop - start > 1:
+            # Array unpackers read the payload, by the field's position in the definition
+            array_start = def_mesg.value_slices[n][0]
+            unpacker = def_mesg.array_unpackers.get(array_start) if def_mesg.array_unpackers else None
+            if unpacker is not None:
+                namespace['unpack_%d' % n] = unpacker
+                lines.append('    r%d = unpack_%d(data)' % (n, n))
+            else:
+                lines.append('    r%d = tuple(parse_%d(x) for x in v[%d:%d])' % (n, n, start, stop))
+        elif base_type.name == 'byte' or base_type is not BASE_TYPES.get(base_type.identifier):
+            lines.append('    r%d = parse_%d(v[%d])' % (n, n, start))
+        elif base_type.fmt in 'fd':
+            # NaN is the only float that isn't equal to itself
+            lines.append('    r%d = v[%d]' % (n, start))
+            lines.append('    if r%d != r%d:' % (n, n))
+            lines.append('        r%d = None' % n)
+        elif base_type.fmt == 's':
+            lines.append('    r%d = parse_%d(v[%d])' % (n, n, start))
+        else:
+            lines.append('    r%d = v[%d]' % (n, start))
+            lines.append('    if r%d == %r:' % (n, base_type.invalid))
+            lines.append('        r%d = None' % n)
+    return lines
+
+
+def _component_lines(n, cmp_plan, namespace):
+    # Lines setting k<n>_<def num> to the final value of a component of field
+    # n, out of its source value c<n>, the way FitFileDecoder._decode_field
+    # works it out
+    component, cmp_field, bit_offset, mask, scale, offset = cmp_plan
+    key = '%d_%d' % (n, component.def_num)
+    value = '(c%d >> %d) & %d' % (n, bit_offset, mask)
+    if scale:
+        value = 'float(%s) / %r' % (value, scale)
+    if offset:
+        value += ' - %r' % offset
+    lines = ['    k%s = None if c%d is None else %s' % (key, n, value)]
+    if cmp_field.type.values:
+        namespace['values_%s' % key] = cmp_field.type.values
+        lines.append('    k%s = values_%s.get(k%s, k%s)' % (key, key, key, key))
+    converter = EPOCH_TYPE_CONVERTERS.get(cmp_field.type.name)
+    if converter is not None:
+        namespace['convert_%s' % key] = converter
+        lines.append('    k%s = convert_%s(k%s)' % (key, key, key))
+    return 'k%s' % key, lines
+
+
+def _value_expression(n, field, namespace):
+    # Expression rendering and scaling the raw value r<n> of a plain scalar field
+    value = 'r%d' % n
+    if field is not None:
+        if field.type.values:
+            namespace['values_%d' % n] = field.type.values
+            value = 'values_%d.get(r%d, r%d)' % (n, n, n)
+        elif field.scale or field.offset:
+            value = 'float(r%d)' % n if field.scale else value
+            if field.scale:
+                value += ' / %r' % field.scale
+            if field.offset:
+                value += ' - %r' % field.offset
+            value = 'None if r%d is None else %s' % (n, value)
+    return value
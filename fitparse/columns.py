@@ -0,0 +1,439 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from fitparse.processors import UTC_REFERENCE
+from fitparse.profile import FIELD_TYPE_TIMESTAMP
+from fitparse.records import DevFieldDefinition, parse_string
+
+# struct format -> numpy type code
+NUMPY_TYPES = {
+    'b': 'i1', 'B': 'u1', 'h': 'i2', 'H': 'u2', 'i': 'i4', 'I': 'u4',
+    'q': 'i8', 'Q': 'u8', 'f': 'f4', 'd': 'f8',
+}
+
+SEMICIRCLES_TO_DEGREES = 180.0 / 2 ** 31
+
+# Field types holding seconds since UTC_REFERENCE
+DATE_TIME_TYPES = ('date_time', 'local_date_time')
+
+# Smaller date_time values are seconds relative to the device's power up
+# rather than dates, and are left as they are (see process_type_date_time)
+MIN_DATE_TIME = 0x10000000
+
+
+class ColumnGroup(object):
+    """Payloads of all data messages sharing one definition layout"""
+
+    def __init__(self, number, def_mesg):
+        self.number = number
+        self.def_mesg = def_mesg
+        self.field_defs = def_mesg.field_defs + def_mesg.dev_field_defs
+        self.payloads = []
+
+    def find_field(self, name):
+        for n, field_def in enumerate(self.field_defs):
+            if field_def.name == name:
+                return n
+            # Developer field numbers clash with the profile's, so those
+            # can only be selected by name
+            if field_def.def_num == name and not isinstance(field_def, DevFieldDefinition):
+                return n
+        return None
+
+    def find_components(self, name):
+        # (field index, component number, component) of all components that
+        # expand into name. Fields with subfields are left out as subfields
+        # are not resolved here.
+        found = []
+        mesg_type = self.def_mesg.mesg_type
+        for n, field_def in enumerate(self.def_mesg.field_defs):
+            field = field_def.field
+            if not field or field.subfields or not field.components:
+                continue
+            for k, component in enumerate(field.components):
+                target = mesg_type.fields[component.def_num]
+                if name in (target.name, target.def_num):
+                    found.append((n, k, component))
+        return found
+
+    def decode(self, names):
+        # Decode the requested fields of all payloads with a single structured
+        # dtype. Returns the decoded fields, and the raw values of components
+        # for names that are not fields of this definition, or are expanded
+        # from the components of an earlier field (which DataMessage.get()
+        # finds first).
+        indexes, components = {}, {}
+        for name in names:
+            n = self.find_field(name)
+            found = self.find_components(name)
+            if n is not None and not (found and found[0][0] < n):
+                indexes[name] = n
+            elif found:
+                components[name] = found
+        if not (indexes or components) or not self.payloads:
+            return {}, {}
+
+        sources = set(indexes.values())
+        for found in components.values():
+            sources.update(n for n, _, _ in found)
+        rows = self.read_rows(sorted(sources))
+
+        fields = dict(
+            (name, decode_column(self.field_defs[n], rows['f%d' % n]))
+            for name, n in indexes.items()
+        )
+        component_parts = {}
+        for name, found in components.items():
+            parts = []
+            for n, k, component in found:
+                part = render_component(component, self.field_defs[n], rows['f%d' % n])
+                if part is not None:
+                    parts.append(((self.field_defs[n].def_num, k), component, part))
+            component_parts[name] = parts
+        return fields, component_parts
+
+    def read_rows(self, indexes):
+        endian = self.def_mesg.endian
+        dtype_names, dtype_formats, dtype_offsets = [], [], []
+        for n in indexes:
+            field_def = self.field_defs[n]
+            base_type = field_def.base_type
+            if base_type.fmt == 's':
+                fmt = 'S%d' % field_def.size
+            else:
+                count = field_def.size // base_type.size
+                fmt = endian + NUMPY_TYPES[base_type.fmt]
+                if count != 1 or base_type.name == 'byte':
+                    fmt = (fmt, (count,))
+            dtype_names.append('f%d' % n)
+            dtype_formats.append(fmt)
+            dtype_offsets.append(self.def_mesg.field_offsets[n])
+        dtype = np.dtype({
+            'names': dtype_names, 'formats': dtype_formats,
+            'offsets': dtype_offsets, 'itemsize': self.def_mesg.data_struct.size,
+        })
+        return np.frombuffer(b''.join(self.payloads), dtype=dtype)
+
+
+def decode_column(field_def, raw):
+    """Scrub, scale and convert one raw column, returning (values, invalid)"""
+    base_type = field_def.base_type
+    field = field_def.field
+
+    if base_type.fmt == 's':
+        values = np.array([parse_string(value) for value in raw.tolist()], dtype=object)
+        return values, np.equal(values, None)
+
+    # Swap to native byte order
+    raw = raw.astype(raw.dtype.newbyteorder('='), copy=False)
+
+    if base_type.fmt in 'fd':
+        invalid = np.isnan(raw)
+    elif base_type.name == 'byte':
+        # Byte arrays are only invalid as a whole
+        invalid = np.all(raw == base_type.invalid, axis=1)
+        invalid = np.repeat(invalid[:, np.newaxis], raw.shape[1], axis=1)
+    else:
+        invalid = raw == base_type.invalid
+
+    values = raw
+    if field is not None and field.type.name in DATE_TIME_TYPES and raw.ndim == 1:
+        return date_time_column(field.type.name, raw, invalid)
+    if field is not None:
+        if field.scale:
+            values = values / float(field.scale)
+        if field.offset:
+            values = values - field.offset
+        if field.units == 'semicircles':
+            values = values * SEMICIRCLES_TO_DEGREES
+    return values, invalid
+
+
+def compile_array_unpacker(endian, field_def, offset):
+    """Function unpacking a multi-value field out of a data message payload
+
+    The values are copied out of the payload in one step, into a float64
+    array with NaN in place of the invalid values.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for decoding fields to arrays")
+
+    base_type = field_def.base_type
+    dtype = np.dtype(endian + NUMPY_TYPES[base_type.fmt])
+    count = field_def.size // base_type.size
+    # Floats are invalid when NaN already
+    invalid_value = None if base_type.fmt in 'fd' else base_type.invalid
+
+    def unpack(data):
+        raw = np.frombuffer(data, dtype, count, offset)
+        values = raw.astype(np.float64)
+        if invalid_value is not None:
+            values[raw == invalid_value] = np.nan
+        return values
+
+    return unpack
+
+
+def to_datetime64(raw):
+    """Convert FIT date_time seconds to datetime64[s] (UTC)"""
+    return (raw.astype(np.int64) + UTC_REFERENCE).astype('datetime64[s]')
+
+
+def date_time_column(type_name, raw, invalid):
+    """Convert a date_time or local_date_time column, returning (values,
+    invalid)
+
+    Like FitFileDataProcessor, relative date_time values are kept as
+    seconds: a column of only those stays numbers, and they are masked in a
+    column of datetime64 dates.
+    """
+    if type_name == 'date_time':
+        relative = ~invalid & (raw < MIN_DATE_TIME)
+        if relative.any():
+            if not np.any(~invalid & ~relative):
+                return raw.astype(np.int64), invalid
+            invalid = invalid | relative
+    return to_datetime64(raw), invalid
+
+
+def render_component(component, field_def, raw):
+    """Mask one component out of a raw column, returning (values, invalid)
+
+    Byte arrays are read as little endian numbers, only the bytes holding the
+    component are combined. Returns None for components the field can't hold.
+    """
+    base_type = field_def.base_type
+    mask = (1 << component.bits) - 1
+    raw = raw.astype(raw.dtype.newbyteorder('='), copy=False)
+
+    if base_type.name == 'byte':
+        width = raw.shape[1]
+        if width > 1 and component.bit_offset and component.bit_offset >= width << 3:
+            return None
+        invalid = np.all(raw == base_type.invalid, axis=1)
+        first = component.bit_offset >> 3
+        last = min((component.bit_offset + component.bits - 1) >> 3, width - 1)
+        values = np.zeros(len(raw), dtype=np.uint64)
+        for i in range(first, last + 1):
+            values |= raw[:, i].astype(np.uint64) << np.uint64((i - first) << 3)
+        values = (values >> np.uint64(component.bit_offset & 7)) & np.uint64(mask)
+        return values.astype(np.int64), invalid
+
+    if raw.ndim > 1 or base_type.fmt in 'fds':
+        # Only integers and byte arrays have components
+        return None
+    invalid = raw == base_type.invalid
+    return (raw.astype(np.int64) >> component.bit_offset) & mask, invalid
+
+
+def accumulate_column(values, resets, bits):
+    """Accumulate a masked (rows, n) column of components, in row order
+
+    Like FitFileDecoder._apply_compressed_accumulation, every value adds its
+    distance (modulo 2 ** bits) from the previous one, starting from 0 again
+    at the rows in resets.
+    """
+    flat = values.reshape(-1)
+    valid = np.flatnonzero(~np.ma.getmaskarray(flat))
+    if not len(valid):
+        return values
+    seq = flat.data[valid]
+    rows = valid // (values.shape[1] if values.ndim > 1 else 1)
+
+    # Number of resets seen up to each value; a value starts a new run when
+    # that changes (the first value always does)
+    segments = np.searchsorted(resets, rows, side='right')
+    starts = np.ones(len(seq), dtype=bool)
+    starts[1:] = segments[1:] != segments[:-1]
+
+    previous = np.zeros(len(seq), dtype=np.int64)
+    previous[1:] = seq[:-1]
+    previous[starts] = 0
+    deltas = (seq - previous) % (1 << bits)
+    totals = np.cumsum(deltas)
+    run_offsets = (totals - deltas)[starts]
+    seq = totals - run_offsets[np.cumsum(starts) - 1]
+
+    result = values.copy()
+    result.data.reshape(-1)[valid] = seq
+    return result
+
+
+def build_component_column(parts, row_groups, row_defs, def_mesgs):
+    """Stitch, accumulate and scale the components expanding into one column"""
+    keys, components = [], {}
+    for _, key, component, _ in parts:
+        if key not in components:
+            keys.append(key)
+            components[key] = component
+    columns = dict(
+        (key, stitch_column(row_groups, [(number, part) for number, k, _, part in parts if k == key]))
+        for key in keys
+    )
+
+    accumulating = [key for key in keys if components[key].accumulate]
+    if accumulating:
+        bits = set(components[key].bits for key in accumulating)
+        target = components[accumulating[0]].def_num
+        # Accumulators restart whenever a definition with this component is parsed,
+        # which is taken as the first row using that definition
+        restarting = [
+            n for n, def_mesg in enumerate(def_mesgs)
+            if any(
+                component.accumulate and component.def_num == target
+                for field_def in def_mesg.field_defs if field_def.field
+                for component in field_def.field.components or ()
+            )
+        ]
+        _, first_rows = np.unique(row_defs, return_index=True)
+        resets = np.sort(first_rows[restarting])
+        stacked = np.ma.column_stack([columns[key] for key in accumulating])
+        if len(bits) == 1:
+            stacked = accumulate_column(stacked, resets, bits.pop())
+        else:
+            stacked = accumulate_sequential(stacked, resets, [components[key].bits for key in accumulating])
+        for i, key in enumerate(accumulating):
+            columns[key] = stacked[:, i]
+
+    scaled = []
+    for key in keys:
+        component, values = components[key], columns[key]
+        if component.scale:
+            values = values / float(component.scale)
+        if component.offset:
+            values = values - component.offset
+        scaled.append(values)
+    if len(scaled) == 1:
+        return scaled[0]
+    return np.ma.column_stack(scaled)
+
+
+def accumulate_sequential(values, resets, bits):
+    # Fallback for components of different sizes accumulating into one field
+    result = values.copy()
+    resets = set(resets.tolist())
+    accumulation = 0
+    for row in range(values.shape[0]):
+        if row in resets:
+            accumulation = 0
+        for i in range(values.shape[1]):
+            if values.mask is not np.ma.nomask and values.mask[row, i]:
+                continue
+            raw_value, max_value = int(values.data[row, i]), 1 << bits[i]
+            accumulation += (raw_value - accumulation) % max_value
+            result.data[row, i] = accumulation
+    return result
+
+
+def build_columns(payloads, fields=None, start=None, end=None):
+    """Build masked NumPy columns from (def_mesg, data, timestamp) payloads
+
+    Payloads are grouped by definition layout and each group is decoded in
+    one go, then the groups are stitched back together in file order. Given
+    start and/or end (raw timestamps), only the rows with a timestamp in
+    between are kept, after accumulating components over all of them.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for columnar decoding")
+
+    groups = []
+    groups_by_def = {}
+    groups_by_layout = {}
+    def_mesgs = []
+    row_groups = []
+    row_defs = []
+    timestamps = []
+    for def_mesg, data, timestamp in payloads:
+        group = groups_by_def.get(def_mesg)
+        if group is None:
+            # Redefinitions of the same layout share a group
+            layout = (def_mesg.data_struct.format, tuple(
+                (fd.def_num, fd.name, fd.size) for fd in def_mesg.field_defs + def_mesg.dev_field_defs
+            ))
+            group = groups_by_layout.get(layout)
+            if group is None:
+                group = groups_by_layout[layout] = ColumnGroup(len(groups), def_mesg)
+                groups.append(group)
+            groups_by_def[def_mesg] = group
+            def_mesgs.append(def_mesg)
+        if data:
+            group.payloads.append(data)
+        row_groups.append(group.number)
+        row_defs.append(len(def_mesgs) - 1)
+        timestamps.append(timestamp)
+
+    if fields is None:
+        names = []
+        for group in groups:
+            for field_def in group.field_defs:
+                if field_def.name not in names:
+                    names.append(field_def.name)
+    else:
+        names = list(fields)
+
+    row_groups = np.array(row_groups, dtype=np.intp)
+    row_defs = np.array(row_defs, dtype=np.intp)
+    decoded = [group.decode(names) for group in groups]
+
+    columns = {}
+    for name in names:
+        if name in (FIELD_TYPE_TIMESTAMP.name, FIELD_TYPE_TIMESTAMP.def_num):
+            # Timestamps come from the decoder, as compressed timestamp
+            # headers don't have a timestamp field
+            invalid = np.equal(np.array(timestamps, dtype=object), None)
+            values = np.array([0 if ts is None else ts for ts in timestamps], dtype=np.int64)
+            values, invalid = date_time_column(FIELD_TYPE_TIMESTAMP.type.name, values, invalid)
+            columns[name] = np.ma.MaskedArray(values, mask=invalid)
+            continue
+
+        parts = [(n, part[name]) for n, (part, _) in enumerate(decoded) if name in part]
+        component_parts = [
+            (n, key, component, part)
+            for n, (_, cmp_part) in enumerate(decoded)
+            for key, component, part in cmp_part.get(name, ())
+        ]
+        column = stitch_column(row_groups, parts)
+        if component_parts:
+            # Expanded from components of other fields where it's not a field
+            expanded = build_component_column(component_parts, row_groups, row_defs, def_mesgs)
+            if not parts:
+                column = expanded
+            elif column.ndim == expanded.ndim == 1:
+                from_components = ~np.isin(row_groups, [n for n, _ in parts])
+                column = np.ma.where(from_components, expanded, column)
+        columns[name] = column
+
+    if start is not None or end is not None:
+        keep = np.array([
+            ts is not None and (start is None or ts >= start) and (end is None or ts <= end) for ts in timestamps
+        ], dtype=bool)
+        columns = dict((name, column[keep]) for name, column in columns.items())
+
+    return columns
+
+
+def stitch_column(row_groups, parts):
+    """Put the per-group (values, invalid) parts of a column back in row order"""
+    if not parts:
+        # Not present in any of the definitions, all invalid
+        return np.ma.masked_all((len(row_groups),), dtype=np.float64)
+
+    dtype = np.result_type(*[values.dtype for _, (values, _) in parts])
+    width = max(values.shape[1] if values.ndim > 1 else 0 for _, (values, _) in parts)
+    shape = (len(row_groups), width) if width else (len(row_groups),)
+
+    values_out = np.zeros(shape, dtype=dtype)
+    invalid_out = np.ones(shape, dtype=bool)
+    for number, (values, invalid) in parts:
+        rows = row_groups == number
+        if width and values.ndim == 1:
+            values, invalid = values[:, np.newaxis], invalid[:, np.newaxis]
+        if width:
+            values_out[rows, :values.shape[1]] = values
+            invalid_out[rows, :values.shape[1]] = invalid
+        else:
+            values_out[rows] = values
+            invalid_out[rows] = invalid
+    return np.ma.MaskedArray(values_out, mask=invalid_out)
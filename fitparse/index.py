@@ -0,0 +1,152 @@
+import json
+import zlib
+
+from fitparse.records import RecordBase
+from fitparse.utils import FitParseError
+
+# Data messages between checkpoints, ie. the most messages decoded (or
+# skipped) to get from a checkpoint to the message asked for
+CHECKPOINT_INTERVAL = 1000
+
+INDEX_VERSION = 2
+
+
+class Checkpoint(RecordBase):
+    """Decoder state right before the data message at position"""
+    __slots__ = ('position', 'offset', 'bytes_left', 'segment_start', 'definitions', 'accumulators',
+                 'compressed_ts', 'num_dev_data')
+
+
+class MessageIndex(object):
+    """Byte offset, global message number and raw timestamp of every data
+    message in a FIT file, with checkpoints to resume decoding from.
+
+    Build one with FitFileDecoder.build_index() and read messages through it
+    with FitFileDecoder.get_messages_by_index(). Indexes can be kept around
+    with save() and load(), or to_dict() and from_dict() for other storage.
+    """
+
+    def __init__(self, size, crc32, checkpoint_interval=CHECKPOINT_INTERVAL):
+        # Identify the file the index belongs to
+        self.size = size
+        self.crc32 = crc32
+        self.checkpoint_interval = checkpoint_interval
+
+        # One entry per data message, in file order
+        self.offsets = []
+        self.mesg_nums = []
+        self.timestamps = []
+
+        self.mesg_names = {}
+        # (definition offset, message offset) of the developer data messages,
+        # replayed to restore the developer fields at a checkpoint
+        self.dev_data = []
+        self.checkpoints = []
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __repr__(self):
+        return '<MessageIndex: %d messages, %d checkpoints>' % (len(self.offsets), len(self.checkpoints))
+
+    @staticmethod
+    def fingerprint(data):
+        return len(data), zlib.crc32(data) & 0xFFFFFFFF
+
+    def check(self, data):
+        if self.fingerprint(data) != (self.size, self.crc32):
+            raise FitParseError("Message index doesn't match this FIT file")
+
+    def find(self, names=None, start=None, end=None):
+        """Positions of the data messages of the given message names (or
+        numbers), with a raw timestamp between start and end (inclusive)"""
+        if names is not None:
+            mesg_nums = set(
+                mesg_num for mesg_num, name in self.mesg_names.items()
+                if name in names or mesg_num in names
+            )
+        positions = []
+        for position, (mesg_num, timestamp) in enumerate(zip(self.mesg_nums, self.timestamps)):
+            if names is not None and mesg_num not in mesg_nums:
+                continue
+            if start is not None or end is not None:
+                if timestamp is None:
+                    continue
+                if (start is not None and timestamp < start) or (end is not None and timestamp > end):
+                    continue
+            positions.append(position)
+        return positions
+
+    def checkpoint_for(self, position):
+        """The last checkpoint at or before position"""
+        # There is one every checkpoint_interval data messages, from the first one
+        return self.checkpoints[position // self.checkpoint_interval]
+
+    ##########
+    # Storage
+
+    def to_dict(self):
+        return {
+            'version': INDEX_VERSION,
+            'size': self.size,
+            'crc32': self.crc32,
+            'checkpoint_interval': self.checkpoint_interval,
+            'offsets': self.offsets,
+            'mesg_nums': self.mesg_nums,
+            'timestamps': self.timestamps,
+            'mesg_names': sorted(self.mesg_names.items()),
+            'dev_data': self.dev_data,
+            'checkpoints': [
+                {
+                    'position': cp.position,
+                    'offset': cp.offset,
+                    'bytes_left': cp.bytes_left,
+                    'segment_start': cp.segment_start,
+                    'definitions': sorted(cp.definitions.items()),
+                    'accumulators': sorted(
+                        (mesg_num, sorted(accumulator.items())) for mesg_num, accumulator in cp.accumulators.items()
+                    ),
+                    'compressed_ts': cp.compressed_ts,
+                    'num_dev_data': cp.num_dev_data,
+                }
+                for cp in self.checkpoints
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != INDEX_VERSION:
+            raise FitParseError('Unsupported message index version: %r' % data.get('version'))
+        index = cls(data['size'], data['crc32'], data['checkpoint_interval'])
+        index.offsets = list(data['offsets'])
+        index.mesg_nums = list(data['mesg_nums'])
+        index.timestamps = list(data['timestamps'])
+        index.mesg_names = dict((mesg_num, name) for mesg_num, name in data['mesg_names'])
+        index.dev_data = [tuple(offsets) for offsets in data['dev_data']]
+        index.checkpoints = [
+            Checkpoint(
+                position=cp['position'],
+                offset=cp['offset'],
+                bytes_left=cp['bytes_left'],
+                segment_start=cp['segment_start'],
+                definitions=dict((local_mesg_num, offset) for local_mesg_num, offset in cp['definitions']),
+                accumulators=dict(
+                    (mesg_num, dict((def_num, value) for def_num, value in accumulator))
+                    for mesg_num, accumulator in cp['accumulators']
+                ),
+                compressed_ts=cp['compressed_ts'],
+                num_dev_data=cp['num_dev_data'],
+            )
+            for cp in data['checkpoints']
+        ]
+        return index
+
+    def save(self, path):
+        """Write the index to path as JSON, e.g. a sidecar next to the FIT file"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,154 @@
+"""Decoding FIT files in worker processes"""
+
+import os
+
+from fitparse.base import UncachedFitFile
+from fitparse.utils import is_iterable
+
+# Smallest stretch of a file worth handing to a worker process
+MIN_CHUNK_SIZE = 64 * 1024
+
+# Chunks per worker when splitting a file, so a slow chunk doesn't hold up
+# the others for long
+CHUNKS_PER_WORKER = 4
+
+# What the worker processes decode, set up once per process by _init_worker
+_worker_state = {}
+
+
+def split_chunks(index, positions, chunk_size):
+    """Group sorted index positions into chunks of at least chunk_size
+    bytes of the file, each starting at one of the index's checkpoints"""
+    # Offsets the checkpoints start at, in position order
+    bounds = []
+    for checkpoint in index.checkpoints:
+        if not bounds or checkpoint.offset - bounds[-1][1] >= chunk_size:
+            bounds.append((checkpoint.position, checkpoint.offset))
+
+    chunks = []
+    n = 0
+    for i in range(len(bounds)):
+        stop = bounds[i + 1][0] if i + 1 < len(bounds) else len(index)
+        chunk = []
+        while n < len(positions) and positions[n] < stop:
+            chunk.append(positions[n])
+            n += 1
+        if chunk:
+            chunks.append(chunk)
+    return chunks
+
+
+def decode_chunks(source, index, chunks, decoder_class, decoder_kwargs, workers=None, fields=None):
+    """Decode the chunks of positions in worker processes, yielding message
+    dicts in file order"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(chunks) <= 1:
+        state = dict(
+            source=source, index=index, decoder_class=decoder_class, decoder_kwargs=decoder_kwargs, fields=fields,
+        )
+        for chunk in chunks:
+            for message in _decode_chunk(chunk, state):
+                yield message
+        return
+
+    # Imported here as it pulls in multiprocessing, which is slow to import
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)), initializer=_init_worker,
+            initargs=(source, index, decoder_class, decoder_kwargs, fields)) as executor:
+        # map() hands back results in the order of the chunks
+        for messages in executor.map(_decode_chunk, chunks):
+            for message in messages:
+                yield message
+
+
+def _init_worker(source, index, decoder_class, decoder_kwargs, fields):
+    _worker_state.update(
+        source=source, index=index, decoder_class=decoder_class, decoder_kwargs=decoder_kwargs, fields=fields,
+    )
+
+
+def _decode_chunk(positions, state=None):
+    # Message objects refer to profile and base type objects that don't
+    # pickle, so they travel back to the parent process as dicts
+    if state is None:
+        state = _worker_state
+    decoder = state['decoder_class'](state['source'], buffered=True, **state['decoder_kwargs'])
+    try:
+        return [
+            message.as_dict() for message in decoder._decode_positions(state['index'], positions, state['fields'])
+        ]
+    finally:
+        decoder.close()
+
+
+def decode_many(paths, message_types=None, fields=None, workers=None, ordered=True, columns=False, **kwargs):
+    """Decode many FIT files, one per worker process at a time.
+
+    Each worker loads the profile once and reuses it for all of its files,
+    sending back only plain values rather than message objects.
+
+    :param paths: FIT file paths
+    :param message_types: message name(s) or number(s) to decode, None for
+                          all of them (needs to be given with columns=True)
+    :param fields: field names to decode, None for all of them
+    :param workers: number of worker processes, None for one per CPU
+    :param ordered: yield files in the order of paths, or else as soon as
+                    each one is done
+    :param columns: decode each message type to NumPy arrays, as
+                    FitFileDecoder.get_columns() does, instead of rows
+    :param kwargs: passed on to UncachedFitFile, such as data_processor
+    :return: iterator of (path, result) with result a dict of message name
+             to a list of {field name: value} rows (or a dict of columns),
+             or the exception (a FitParseError, or e.g. an OSError for a
+             missing file) raised for a file that couldn't be decoded
+    """
+    if message_types is not None and not is_iterable(message_types):
+        message_types = [message_types]
+    if columns and message_types is None:
+        raise ValueError('Decoding to columns needs the message types')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    args = (message_types, fields, columns, kwargs)
+
+    if workers <= 1:
+        for path in paths:
+            yield path, _decode_file(path, *args)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_many_worker) as executor:
+        futures = dict((executor.submit(_decode_file, path, *args), path) for path in paths)
+        for future in (futures if ordered else as_completed(futures)):
+            yield futures[future], future.result()
+
+
+def _init_many_worker():
+    # Load the profile up front, once per process
+    import fitparse.profile  # noqa: F401
+
+
+def _decode_file(path, message_types, fields, columns, decoder_kwargs):
+    try:
+        fitfile = UncachedFitFile(path, buffered=True, **decoder_kwargs)
+        try:
+            if columns:
+                return dict((name, fitfile.get_columns(name, fields)) for name in message_types)
+
+            result = {}
+            for message in fitfile.get_messages(message_types, fields=fields):
+                values = message.get_values()
+                if fields is not None:
+                    values = dict((name, values.get(name)) for name in fields)
+                result.setdefault(message.name, []).append(values)
+            return result
+        finally:
+            fitfile.close()
+    except Exception as e:
+        # Unreadable and broken files are reported in place of their result,
+        # rather than bringing down the whole batch
+        return e
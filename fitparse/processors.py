@@ -5,6 +5,48 @@ from fitparse.utils import scrub_method_name, is_iterable
 UTC_REFERENCE = 631065600  # timestamp for UTC 00:00 Dec 31 1989
 
 
+def fit_timestamp(value):
+    """Convert a datetime (naive ones are taken as UTC) or a Unix epoch to a raw
+    FIT timestamp, ie. seconds since UTC_REFERENCE"""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        value = value.timestamp()
+    return int(value) - UTC_REFERENCE
+
+
+def convert_bool(value):
+    return bool(value) if value is not None else None
+
+
+def convert_date_time(value):
+    if value is not None and value >= 0x10000000:
+        return UTC_REFERENCE + value
+    return value
+
+
+def convert_local_date_time(value):
+    return UTC_REFERENCE + value if value is not None else None
+
+
+def convert_localtime_into_day(value):
+    if value is None:
+        return None
+    m, s = divmod(value, 60)
+    h, m = divmod(m, 60)
+    return datetime.time(h, m, s)
+
+
+# What the type processors of FitFileDataProcessor(epoch_timestamps=True) do
+# to values, for decoding without FieldData objects
+EPOCH_TYPE_CONVERTERS = {
+    'bool': convert_bool,
+    'date_time': convert_date_time,
+    'local_date_time': convert_local_date_time,
+    'localtime_into_day': convert_localtime_into_day,
+}
+
+
 class FitFileDataProcessor(object):
     # TODO: Document API
     # Functions that will be called to do the processing:
@@ -22,6 +64,13 @@ class FitFileDataProcessor(object):
     # Used to memoize scrubbed method names
     _scrubbed_method_names = {}
 
+    # Keep date_time and local_date_time values as integer Unix epochs
+    # instead of creating a datetime for each of them
+    epoch_timestamps = False
+
+    def __init__(self, epoch_timestamps=False):
+        self.epoch_timestamps = epoch_timestamps
+
     def _scrub_method_name(self, method_name):
         """Scrubs a method name, returning result from local cache if available.
 
@@ -41,27 +90,68 @@ class FitFileDataProcessor(object):
         return self._scrubbed_method_names[method_name]
 
     def run_type_processor(self, field_data):
-        self._run_processor(self._scrub_method_name(
-            'process_type_%s' % field_data.type.name), field_data)
+        self._run_processor(self.get_type_processor(field_data), field_data)
 
     def run_field_processor(self, field_data):
-        self._run_processor(self._scrub_method_name(
-            'process_field_%s' % field_data.name), field_data)
+        self._run_processor(self.get_field_processor(field_data), field_data)
 
     def run_unit_processor(self, field_data):
-        if field_data.units:
-            self._run_processor(self._scrub_method_name(
-                'process_units_%s' % field_data.units), field_data)
+        self._run_processor(self.get_unit_processor(field_data.units), field_data)
 
     def run_message_processor(self, data_message):
-        self._run_processor(self._scrub_method_name(
-            'process_message_%s' % data_message.def_mesg.name), data_message)
+        self._run_processor(self.get_message_processor(data_message.def_mesg), data_message)
+
+    def _run_processor(self, processor, data):
+        if processor is not None:
+            processor(data)
+
+    # Look up the process_* method for a field, units or message, None if there is none
+    def get_type_processor(self, field_data):
+        return self._get_processor('process_type_%s' % field_data.type.name)
 
-    def _run_processor(self, processor_name, data):
-        try:
-            getattr(self, processor_name)(data)
-        except AttributeError:
-            pass
+    def get_field_processor(self, field_data):
+        return self._get_processor('process_field_%s' % field_data.name)
+
+    def get_unit_processor(self, units):
+        if units:
+            return self._get_processor('process_units_%s' % units)
+        return None
+
+    def get_message_processor(self, def_mesg):
+        return self._get_processor('process_message_%s' % def_mesg.name)
+
+    def _get_processor(self, processor_name):
+        return getattr(self, self._scrub_method_name(processor_name), None)
+
+    # Resolve the callables to run, so a decoder can do it once and cache the
+    # result. run_* methods overridden by a subclass are used as they are.
+    def resolve_field_processors(self, field_data):
+        """Returns the type and field processors to run on field_data, in order.
+
+        Args:
+            field_data: FieldData to resolve the processors of. Only its field
+                (or field definition for unknown fields) is used, so the result
+                holds for all FieldData of the same field.
+
+        Returns:
+            List of callables taking field_data, empty if there's nothing to run.
+        """
+        processors = [
+            self._resolve_processor('run_type_processor', self.get_type_processor, field_data),
+            self._resolve_processor('run_field_processor', self.get_field_processor, field_data),
+        ]
+        return [processor for processor in processors if processor is not None]
+
+    def resolve_unit_processor(self, units):
+        return self._resolve_processor('run_unit_processor', self.get_unit_processor, units)
+
+    def resolve_message_processor(self, def_mesg):
+        return self._resolve_processor('run_message_processor', self.get_message_processor, def_mesg)
+
+    def _resolve_processor(self, run_name, get_processor, key):
+        if getattr(type(self), run_name) is not getattr(FitFileDataProcessor, run_name):
+            return getattr(self, run_name)
+        return get_processor(key)
 
     def process_type_bool(self, field_data):
         if field_data.value is not None:
@@ -70,7 +160,10 @@ class FitFileDataProcessor(object):
     def process_type_date_time(self, field_data):
         value = field_data.value
         if value is not None and value >= 0x10000000:
-            field_data.value = datetime.datetime.utcfromtimestamp(UTC_REFERENCE + value)
+            if self.epoch_timestamps:
+                field_data.value = UTC_REFERENCE + value
+            else:
+                field_data.value = datetime.datetime.utcfromtimestamp(UTC_REFERENCE + value)
             field_data.units = None  # Units were 's', set to None
 
     def process_type_local_date_time(self, field_data):
@@ -78,7 +171,10 @@ class FitFileDataProcessor(object):
             # NOTE: This value was created on the device using it's local timezone.
             #       Unless we know that timezone, this value won't be correct. However, if we
             #       assume UTC, at least it'll be consistent.
-            field_data.value = datetime.datetime.utcfromtimestamp(UTC_REFERENCE + field_data.value)
+            if self.epoch_timestamps:
+                field_data.value = UTC_REFERENCE + field_data.value
+            else:
+                field_data.value = datetime.datetime.utcfromtimestamp(UTC_REFERENCE + field_data.value)
             field_data.units = None
 
     def process_type_localtime_into_day(self, field_data):
@@ -90,33 +186,36 @@ class FitFileDataProcessor(object):
 
 
 class StandardUnitsDataProcessor(FitFileDataProcessor):
-    def run_field_processor(self, field_data):
+    def get_field_processor(self, field_data):
         """
         Convert all '*_speed' fields using 'process_field_speed'
         All other units will use the default method.
         """
         if field_data.name.endswith("_speed"):
-            self.process_field_speed(field_data)
-        else:
-            super(StandardUnitsDataProcessor, self).run_field_processor(field_data)
+            return self.process_field_speed
+        return super(StandardUnitsDataProcessor, self).get_field_processor(field_data)
+
+    # Values are replaced rather than updated in place below, as they can be
+    # integer NumPy arrays in numpy_arrays mode
 
     def process_field_distance(self, field_data):
         if field_data.value is not None:
-            field_data.value /= 1000.0
+            field_data.value = field_data.value / 1000.0
         field_data.units = 'km'
 
     def process_field_speed(self, field_data):
         if field_data.value is not None:
             factor = 60.0 * 60.0 / 1000.0
 
-            # record.enhanced_speed field can be a tuple
-            if is_iterable(field_data.value):
+            # record.enhanced_speed field can be a tuple (NumPy arrays are
+            # multiplied as a whole)
+            if is_iterable(field_data.value) and not hasattr(field_data.value, 'dtype'):
                 field_data.value = tuple(x * factor for x in field_data.value)
             else:
-                field_data.value *= factor
+                field_data.value = field_data.value * factor
         field_data.units = 'km/h'
 
     def process_units_semicircles(self, field_data):
         if field_data.value is not None:
-            field_data.value *= 180.0 / (2 ** 31)
+            field_data.value = field_data.value * (180.0 / (2 ** 31))
         field_data.units = 'deg'
@@ -19,8 +19,9 @@ class RecordBase(object):
     # namedtuple-like base class. Subclasses should must __slots__
     __slots__ = ()
 
-    # TODO: switch back to namedtuple, and don't use default arguments as None
-    #       and see if that gives us any performance improvements
+    # NOTE: The records built for every message (MessageHeader, DataMessage
+    #       and FieldData) have their own __init__ that assigns their slots
+    #       directly, as this generic one is several times slower
 
     def __init__(self, *args, **kwargs):
         for slot_name, value in zip_longest(self.__slots__, args, fillvalue=None):
@@ -32,6 +33,12 @@ class RecordBase(object):
 class MessageHeader(RecordBase):
     __slots__ = ('is_definition', 'is_developer_data', 'local_mesg_num', 'time_offset')
 
+    def __init__(self, is_definition=None, is_developer_data=None, local_mesg_num=None, time_offset=None):
+        self.is_definition = is_definition
+        self.is_developer_data = is_developer_data
+        self.local_mesg_num = local_mesg_num
+        self.time_offset = time_offset
+
     def __repr__(self):
         return '<MessageHeader: %s%s -- local mesg: #%d%s>' % (
             'definition' if self.is_definition else 'data',
@@ -42,7 +49,10 @@ class MessageHeader(RecordBase):
 
 
 class DefinitionMessage(RecordBase):
-    __slots__ = ('header', 'endian', 'mesg_type', 'mesg_num', 'field_defs', 'dev_field_defs')
+    __slots__ = ('header', 'endian', 'mesg_type', 'mesg_num', 'field_defs', 'dev_field_defs',
+                 'data_struct', 'value_slices', 'field_offsets', 'array_unpackers', 'timestamp_index', 'accumulates',
+                 'subfield_plans', 'component_plans', 'field_layouts', 'decode_function', 'projections',
+                 'row_functions')
     type = 'definition'
 
     @property
@@ -106,15 +116,54 @@ class DevFieldDefinition(RecordBase):
 
 
 class DataMessage(RecordBase):
-    __slots__ = ('header', 'def_mesg', 'fields')
+    __slots__ = ('header', 'def_mesg', 'fields', '_layout_fields')
     type = 'data'
 
+    def __init__(self, header=None, def_mesg=None, fields=None):
+        self.header = header
+        self.def_mesg = def_mesg
+        self.fields = fields
+        self._layout_fields = None
+
     def get(self, field_name, as_dict=False):
         # SIMPLIFY: get rid of as_dict
-        for field_data in self.fields:
+        fields = self.fields
+        layout = self._field_layout(fields)
+        if layout is not None:
+            position = layout[0].get(field_name)
+            if position is None:
+                return None
+            field_data = fields[position]
+            return field_data.as_dict() if as_dict else field_data
+
+        for field_data in fields:
             if field_data.is_named(field_name):
                 return field_data.as_dict() if as_dict else field_data
 
+    def _field_layout(self, fields):
+        # The (name index, sorted order, signature) of the fields of the
+        # definition, if _check_field_layout() found these are its fields
+        if fields is not self._layout_fields:
+            return None
+        return self.def_mesg.field_layouts[self.header.time_offset is not None]
+
+    def _check_field_layout(self):
+        # Called by the decoder once the fields are processed. The layout of
+        # the definition is only used for the very fields it was made for,
+        # not once a data processor has added, removed, replaced or renamed
+        # any of them
+        field_layouts = self.def_mesg.field_layouts
+        if not field_layouts:
+            return
+        fields = self.fields
+        signature = field_layouts[self.header.time_offset is not None][2]
+        if len(fields) != len(signature):
+            return
+        for field_data, (field, field_def) in zip(fields, signature):
+            if field_data.field is not field or field_data.field_def is not field_def:
+                return
+        self._layout_fields = fields
+
     def get_raw_value(self, field_name):
         field_data = self.get(field_name)
         if field_data:
@@ -154,7 +203,11 @@ class DataMessage(RecordBase):
 
     def __iter__(self):
         # Sort by whether this is a known field, then its name
-        return iter(sorted(self.fields, key=lambda fd: (int(fd.field is None), fd.name)))
+        fields = self.fields
+        layout = self._field_layout(fields)
+        if layout is not None:
+            return iter([fields[position] for position in layout[1]])
+        return iter(sorted(fields, key=field_sort_key))
 
     def __repr__(self):
         return '<DataMessage: %s (#%d) -- local mesg: #%d, fields: [%s]>' % (
@@ -167,15 +220,58 @@ class DataMessage(RecordBase):
         return '%s (#%d)' % (self.name, self.mesg_num)
 
 
+class LazyDataMessage(DataMessage):
+    """DataMessage that keeps its raw payload and only decodes its fields
+    the first time they are used"""
+    __slots__ = ('_decoder', '_data', '_timestamp')
+
+    def __init__(self, header, def_mesg, decoder, data, timestamp):
+        self.header = header
+        self.def_mesg = def_mesg
+        self._decoder = decoder
+        self._data = data
+        self._timestamp = timestamp
+        self._layout_fields = None
+
+    def __getattr__(self, name):
+        # Only called while the fields slot is still unset
+        if name != 'fields':
+            raise AttributeError(name)
+        self._decoder._decode_lazy_message(self)
+        # Drop the payload and decoder once decoded
+        self._decoder = self._data = None
+        return self.fields
+
+
+class ProjectedDataMessage(DataMessage):
+    """DataMessage decoded with only some of its fields, see the fields
+    argument of FitFileDecoder.get_messages()"""
+    __slots__ = ()
+
+    def _check_field_layout(self):
+        # The layouts of the definition are for all of its fields
+        pass
+
+
+def field_sort_key(field_data):
+    # Order fields are iterated in: known fields first, then by name
+    return int(field_data.field is None), field_data.name
+
+
 class FieldData(RecordBase):
     __slots__ = ('field_def', 'field', 'parent_field', 'value', 'raw_value', 'units')
 
-    def __init__(self, *args, **kwargs):
-        super(FieldData, self).__init__(self, *args, **kwargs)
-        if not self.units and self.field:
+    def __init__(self, field_def=None, field=None, parent_field=None, value=None, raw_value=None, units=None):
+        self.field_def = field_def
+        self.field = field
+        self.parent_field = parent_field
+        self.value = value
+        self.raw_value = raw_value
+        if not units and field:
             # Default to units on field, otherwise None.
             # NOTE:Not a property since you may want to override this in a data processor
-            self.units = self.field.units
+            units = field.units
+        self.units = units
 
     @property
     def name(self):
@@ -239,7 +335,7 @@ class FieldData(RecordBase):
 
 
 class BaseType(RecordBase):
-    __slots__ = ('name', 'identifier', 'fmt', 'parse')
+    __slots__ = ('name', 'identifier', 'fmt', 'parse', 'invalid')
     values = None  # In case we're treated as a FieldType
 
     @property
@@ -342,13 +438,21 @@ class ComponentField(RecordBase):
         return raw_value
 
 
+def _crc_table():
+    # Byte-indexed table for the FIT CRC-16 (reflected polynomial 0xA001)
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
 class Crc(object):
     """FIT file CRC computation."""
 
-    CRC_TABLE = (
-        0x0000, 0xCC01, 0xD801, 0x1400, 0xF001, 0x3C00, 0x2800, 0xE401,
-        0xA001, 0x6C00, 0x7800, 0xB401, 0x5000, 0x9C01, 0x8801, 0x4400,
-    )
+    CRC_TABLE = _crc_table()
 
     FMT = 'H'
 
@@ -376,57 +480,53 @@ class Crc(object):
     @classmethod
     def calculate(cls, byte_arr, crc=0):
         """Compute CRC for input bytes."""
+        table = cls.CRC_TABLE
         for byte in byte_iter(byte_arr):
-            # Taken verbatim from FIT SDK docs
-            tmp = cls.CRC_TABLE[crc & 0xF]
-            crc = (crc >> 4) & 0x0FFF
-            crc = crc ^ tmp ^ cls.CRC_TABLE[byte & 0xF]
-
-            tmp = cls.CRC_TABLE[crc & 0xF]
-            crc = (crc >> 4) & 0x0FFF
-            crc = crc ^ tmp ^ cls.CRC_TABLE[(byte >> 4) & 0xF]
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
         return crc
 
 
 def parse_string(string):
-    try:
-        try:
-            s = string[:string.index(0x00)]
-        except TypeError: # Python 2 compat
-            s = string[:string.index('\x00')]
-    except ValueError:
-        # FIT specification defines the 'string' type as follows: "Null
-        # terminated string encoded in UTF-8 format".
-        #
-        # However 'string' values are not always null-terminated when encoded,
-        # according to FIT files created by Garmin devices (e.g. DEVICE.FIT file
-        # from a fenix3).
-        #
-        # So in order to be more flexible, in case index() could not find any
-        # null byte, we just decode the whole bytes-like object.
-        s = string
-
-    return s.decode(encoding='utf-8', errors='replace') or None
+    # FIT specification defines the 'string' type as follows: "Null
+    # terminated string encoded in UTF-8 format".
+    #
+    # However 'string' values are not always null-terminated when encoded,
+    # according to FIT files created by Garmin devices (e.g. DEVICE.FIT file
+    # from a fenix3).
+    #
+    # So in order to be more flexible, in case there is no null byte, we just
+    # decode the whole bytes-like object. Either way it's decoded in place,
+    # without copying out the part before the null byte first.
+    end = string.find(b'\x00')
+    if end < 0:
+        end = len(string)
+    return str(memoryview(string)[:end], encoding='utf-8', errors='replace') or None
+
+
+def parse_bytes(value):
+    # Byte arrays are invalid when every byte is 0xFF
+    return None if value.count(0xFF) == len(value) else value
+
 
 # The default base type
-BASE_TYPE_BYTE = BaseType(name='byte', identifier=0x0D, fmt='B', parse=lambda x: None if all(b == 0xFF for b in x) else x)
+BASE_TYPE_BYTE = BaseType(name='byte', identifier=0x0D, fmt='B', parse=parse_bytes, invalid=0xFF)
 
 BASE_TYPES = {
-    0x00: BaseType(name='enum', identifier=0x00, fmt='B', parse=lambda x: None if x == 0xFF else x),
-    0x01: BaseType(name='sint8', identifier=0x01, fmt='b', parse=lambda x: None if x == 0x7F else x),
-    0x02: BaseType(name='uint8', identifier=0x02, fmt='B', parse=lambda x: None if x == 0xFF else x),
-    0x83: BaseType(name='sint16', identifier=0x83, fmt='h', parse=lambda x: None if x == 0x7FFF else x),
-    0x84: BaseType(name='uint16', identifier=0x84, fmt='H', parse=lambda x: None if x == 0xFFFF else x),
-    0x85: BaseType(name='sint32', identifier=0x85, fmt='i', parse=lambda x: None if x == 0x7FFFFFFF else x),
-    0x86: BaseType(name='uint32', identifier=0x86, fmt='I', parse=lambda x: None if x == 0xFFFFFFFF else x),
-    0x07: BaseType(name='string', identifier=0x07, fmt='s', parse=parse_string),
-    0x88: BaseType(name='float32', identifier=0x88, fmt='f', parse=lambda x: None if math.isnan(x) else x),
-    0x89: BaseType(name='float64', identifier=0x89, fmt='d', parse=lambda x: None if math.isnan(x) else x),
-    0x0A: BaseType(name='uint8z', identifier=0x0A, fmt='B', parse=lambda x: None if x == 0x0 else x),
-    0x8B: BaseType(name='uint16z', identifier=0x8B, fmt='H', parse=lambda x: None if x == 0x0 else x),
-    0x8C: BaseType(name='uint32z', identifier=0x8C, fmt='I', parse=lambda x: None if x == 0x0 else x),
+    0x00: BaseType(name='enum', identifier=0x00, fmt='B', parse=lambda x: None if x == 0xFF else x, invalid=0xFF),
+    0x01: BaseType(name='sint8', identifier=0x01, fmt='b', parse=lambda x: None if x == 0x7F else x, invalid=0x7F),
+    0x02: BaseType(name='uint8', identifier=0x02, fmt='B', parse=lambda x: None if x == 0xFF else x, invalid=0xFF),
+    0x83: BaseType(name='sint16', identifier=0x83, fmt='h', parse=lambda x: None if x == 0x7FFF else x, invalid=0x7FFF),
+    0x84: BaseType(name='uint16', identifier=0x84, fmt='H', parse=lambda x: None if x == 0xFFFF else x, invalid=0xFFFF),
+    0x85: BaseType(name='sint32', identifier=0x85, fmt='i', parse=lambda x: None if x == 0x7FFFFFFF else x, invalid=0x7FFFFFFF),
+    0x86: BaseType(name='uint32', identifier=0x86, fmt='I', parse=lambda x: None if x == 0xFFFFFFFF else x, invalid=0xFFFFFFFF),
+    0x07: BaseType(name='string', identifier=0x07, fmt='s', parse=parse_string, invalid=0x00),
+    0x88: BaseType(name='float32', identifier=0x88, fmt='f', parse=lambda x: None if math.isnan(x) else x, invalid=float('nan')),
+    0x89: BaseType(name='float64', identifier=0x89, fmt='d', parse=lambda x: None if math.isnan(x) else x, invalid=float('nan')),
+    0x0A: BaseType(name='uint8z', identifier=0x0A, fmt='B', parse=lambda x: None if x == 0x0 else x, invalid=0x0),
+    0x8B: BaseType(name='uint16z', identifier=0x8B, fmt='H', parse=lambda x: None if x == 0x0 else x, invalid=0x0),
+    0x8C: BaseType(name='uint32z', identifier=0x8C, fmt='I', parse=lambda x: None if x == 0x0 else x, invalid=0x0),
     0x0D: BASE_TYPE_BYTE,
-    0x8E: BaseType(name='sint64', identifier=0x8E, fmt='q', parse=lambda x: None if x == 0x7FFFFFFFFFFFFFFF else x),
-    0x8F: BaseType(name='uint64', identifier=0x8F, fmt='Q', parse=lambda x: None if x == 0xFFFFFFFFFFFFFFFF else x),
-    0x90: BaseType(name='uint64z', identifier=0x90, fmt='Q', parse=lambda x: None if x == 0 else x),
+    0x8E: BaseType(name='sint64', identifier=0x8E, fmt='q', parse=lambda x: None if x == 0x7FFFFFFFFFFFFFFF else x, invalid=0x7FFFFFFFFFFFFFFF),
+    0x8F: BaseType(name='uint64', identifier=0x8F, fmt='Q', parse=lambda x: None if x == 0xFFFFFFFFFFFFFFFF else x, invalid=0xFFFFFFFFFFFFFFFF),
+    0x90: BaseType(name='uint64z', identifier=0x90, fmt='Q', parse=lambda x: None if x == 0 else x, invalid=0x0),
 }
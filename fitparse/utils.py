@@ -1,4 +1,6 @@
 import io
+import mmap
+import os
 import re
 try:
     from collections.abc import Iterable
@@ -71,6 +73,54 @@ def fileish_open(fileish, mode):
     return io.BytesIO(fileish)
 
 
+# Files at least this large are memory mapped instead of read into memory
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+
+def fileish_buffer(fileish, mmap_threshold=MMAP_THRESHOLD):
+    """
+    Load file-ish object into a single buffer.
+    Bytes-like objects and BytesIO are wrapped without a copy, large files are
+    memory mapped and anything else is read in one call.
+    :param fileish: the file-ish object (str, BytesIO, bytes, file contents)
+    :param int mmap_threshold: minimum file size to memory map, None to never mmap
+    :return: memoryview of the contents and the mmap backing it (or None)
+    :rtype: (memoryview, mmap.mmap)
+    """
+    if isinstance(fileish, (bytes, bytearray, memoryview)):
+        return memoryview(fileish), None
+    if isinstance(fileish, io.BytesIO):
+        return fileish.getbuffer(), None
+
+    if hasattr(fileish, 'read') and hasattr(fileish, 'seek'):
+        return _file_buffer(fileish, mmap_threshold)
+
+    fileobj = fileish_open(fileish, 'rb')
+    if isinstance(fileobj, io.BytesIO):
+        # Python2 - file contents passed as str
+        return fileobj.getbuffer(), None
+    with fileobj:
+        return _file_buffer(fileobj, mmap_threshold)
+
+
+def _file_buffer(fileobj, mmap_threshold):
+    try:
+        fileno = fileobj.fileno()
+        size = os.fstat(fileno).st_size
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        fileno = None
+
+    if fileno is not None and mmap_threshold is not None and size >= max(mmap_threshold, 1):
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped), mapped
+
+    position = fileobj.tell()
+    fileobj.seek(0, os.SEEK_SET)
+    data = fileobj.read()
+    fileobj.seek(position, os.SEEK_SET)
+    return memoryview(data), None
+
+
 def is_iterable(obj):
     """Check, if the obj is iterable but not string or bytes.
     :rtype bool"""
@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+"""Tests of the vendored fitparse package, run from the repository root with
+
+    python -m unittest discover -s tests
+"""
+
+import io
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import warnings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from fitparse import (
+    FitFile, FitFileDataProcessor, UncachedFitFile, CachePolicy, FitParseError, MessageIndex, decode_many,
+)
+from fitparse.records import BASE_TYPES, Crc, Field, FieldData
+from fitparse.utils import FitEOFError
+
+NUM_RECORDS = 50
+
+FIT_FILES = ('small.fit', 'big_endian.fit', 'chained.fit')
+
+RECORD_FIELDS = ['timestamp', 'heart_rate', 'speed', 'enhanced_speed', 'altitude', 'distance', 'power_dev', 'missing']
+
+
+def testfile(filename):
+    return os.path.join(os.path.dirname(os.path.realpath(__file__)), 'files', filename)
+
+
+def generate_fitfile(num_records=NUM_RECORDS):
+    """Bytes of a FIT file with a file_id message and num_records records
+    holding a timestamp and heart rate"""
+    data = b''
+    # file_id definition (local 0): type
+    data += struct.pack('<BBBHB', 0x40, 0, 0, 0, 1) + bytes((0, 1, 0x00))
+    data += struct.pack('<BB', 0, 4)
+    # record definition (local 1): timestamp, heart_rate
+    data += struct.pack('<BBBHB', 0x41, 0, 0, 20, 2) + bytes((253, 4, 0x86, 3, 1, 0x02))
+    for n in range(num_records):
+        data += struct.pack('<BIB', 1, 1000000000 + n, 100 + n % 50)
+
+    header = struct.pack('<BBHI4s', 14, 0x10, 2093, len(data), b'.FIT')
+    header += struct.pack('<H', Crc.calculate(header))
+    content = header + data
+    return content + struct.pack('<H', Crc.calculate(content))
+
+
+class FitFileTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempdir, 'activity.fit')
+        with open(self.path, 'wb') as f:
+            f.write(generate_fitfile())
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_cache_replay_from_file_object(self):
+        # Evicted messages are decoded again from the file object, which
+        # has to stay open once the first pass is done
+        for make_fileish in (lambda: open(self.path, 'rb'), lambda: io.BytesIO(generate_fitfile())):
+            fileish = make_fileish()
+            try:
+                fitfile = FitFile(fileish, cache_policy=CachePolicy(max_messages=10))
+                messages = fitfile.messages
+                self.assertEqual(len(messages), NUM_RECORDS + 1)
+                self.assertEqual(len(fitfile.messages), NUM_RECORDS + 1)
+                self.assertFalse(fileish.closed)
+
+                heart_rates = [m.get_value('heart_rate') for m in fitfile.get_messages('record', fields=['heart_rate'])]
+                self.assertEqual(heart_rates, [100 + n % 50 for n in range(NUM_RECORDS)])
+            finally:
+                fileish.close()
+
+    def test_fields_added_by_data_processor(self):
+        zone_field = Field(name='zone', type=BASE_TYPES[0x02], def_num=None)
+
+        class ZoneProcessor(FitFileDataProcessor):
+            def process_message_record(self, data_message):
+                heart_rate = data_message.get_value('heart_rate')
+                data_message.fields.append(FieldData(
+                    field_def=None, field=zone_field, value=heart_rate // 10, raw_value=heart_rate // 10,
+                ))
+
+        for n, message in enumerate(FitFile(self.path, data_processor=ZoneProcessor()).get_messages('record')):
+            self.assertEqual(message.get_value('heart_rate'), 100 + n % 50)
+            self.assertEqual(message.get_value('zone'), (100 + n % 50) // 10)
+            self.assertEqual([field_data.name for field_data in message], ['heart_rate', 'timestamp', 'zone'])
+
+    def test_fields_replaced_by_data_processor(self):
+        # Same number of fields as decoded, but not the same ones
+        pulse_field = Field(name='pulse', type=BASE_TYPES[0x02], def_num=3)
+
+        class PulseProcessor(FitFileDataProcessor):
+            def process_message_record(self, data_message):
+                fields = data_message.fields
+                for n, field_data in enumerate(fields):
+                    if field_data.name == 'heart_rate':
+                        fields[n] = FieldData(
+                            field_def=field_data.field_def, field=pulse_field,
+                            value=field_data.value, raw_value=field_data.raw_value,
+                        )
+                    elif field_data.name == 'timestamp':
+                        field_data.field = Field(name='time', type=field_data.field.type, def_num=253)
+
+        for n, message in enumerate(FitFile(self.path, data_processor=PulseProcessor()).get_messages('record')):
+            self.assertIsNone(message.get('heart_rate'))
+            self.assertEqual(message.get_value('pulse'), 100 + n % 50)
+            self.assertIsNone(message.get('timestamp'))
+            self.assertEqual(message.get_raw_value('time'), 1000000000 + n)
+            self.assertEqual([field_data.name for field_data in message], ['pulse', 'time'])
+
+    def test_truncated_file(self):
+        # Both modes keep the fields read whole of the message cut short and
+        # then run into the end of the file, rather than decoding what's left
+        # as messages
+        with open(testfile('small.fit'), 'rb') as f:
+            data = f.read()
+        for size in (1000, 4321, 9999):
+            path = os.path.join(self.tempdir, 'truncated.fit')
+            with open(path, 'wb') as f:
+                f.write(data[:size])
+
+            results = []
+            for buffered in (False, True):
+                messages = []
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter('always')
+                    with self.assertRaises(FitEOFError):
+                        for message in FitFile(path, check_crc=False, buffered=buffered).get_messages():
+                            messages.append(message.get_values())
+                self.assertTrue(any('terminated unexpectedly' in str(w.message) for w in caught))
+                results.append(messages)
+            self.assertEqual(results[0], results[1])
+            self.assertTrue(results[0][-1])
+
+    def test_index_of_chained_file(self):
+        # Checkpoints past the first file of a chained file restore that
+        # file's definitions and CRC start
+        path = testfile('chained.fit')
+        messages = [m.get_values() for m in FitFile(path).get_messages('record')]
+        for checkpoint_interval in (19, 37, 40, 68):
+            fitfile = FitFile(path)
+            index = fitfile.build_index(checkpoint_interval=checkpoint_interval)
+            self.assertEqual([m.get_values() for m in fitfile.get_messages_by_index(index, 'record')], messages)
+
+    def test_index_save_and_load(self):
+        for filename in FIT_FILES:
+            path = testfile(filename)
+            messages = [m.get_values() for m in FitFile(path).get_messages()]
+            index = FitFile(path).build_index(checkpoint_interval=50)
+            index_path = os.path.join(self.tempdir, filename + '.idx')
+            index.save(index_path)
+            loaded = MessageIndex.load(index_path)
+            self.assertEqual(loaded.to_dict(), index.to_dict())
+
+            fitfile = FitFile(path)
+            self.assertEqual([m.get_values() for m in fitfile.get_messages_by_index(loaded)], messages)
+            positions = loaded.find(['record'])
+            self.assertEqual(
+                [m.get_values() for m in fitfile.get_messages_by_index(loaded, 'record')],
+                [messages[position] for position in positions],
+            )
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_get_columns(self):
+        for filename in FIT_FILES:
+            path = testfile(filename)
+            messages = list(FitFile(path).get_messages('record'))
+            columns = FitFile(path).get_columns('record', RECORD_FIELDS)
+            for name in RECORD_FIELDS:
+                column = columns[name]
+                self.assertEqual(len(column), len(messages))
+                for message, value in zip(messages, column.tolist()):
+                    expected = message.get_value(name)
+                    if name == 'timestamp':
+                        expected = expected.replace(tzinfo=None)
+                    if isinstance(expected, float):
+                        self.assertAlmostEqual(value, expected)
+                    else:
+                        self.assertEqual(value, expected)
+
+    def test_iter_rows(self):
+        processor = FitFileDataProcessor(epoch_timestamps=True)
+        for filename in FIT_FILES:
+            path = testfile(filename)
+            for name, fields in (('record', RECORD_FIELDS), ('event', ['timestamp', 'event', 'timer_trigger', 'data'])):
+                expected = [
+                    tuple(m.get_value(field) for field in fields)
+                    for m in FitFile(path, data_processor=processor).get_messages(name)
+                ]
+                self.assertEqual(list(FitFile(path).iter_rows(name, fields)), expected)
+                rows = list(FitFile(path).iter_rows(name, fields, named=True))
+                self.assertEqual([tuple(row) for row in rows], expected)
+                self.assertEqual(type(rows[0]).__name__, name)
+
+    def test_get_messages_fields(self):
+        fields = ['heart_rate', 'enhanced_speed', 'power_dev', 'missing']
+        for filename in FIT_FILES:
+            path = testfile(filename)
+            messages = list(FitFile(path).get_messages('record'))
+            projected = list(FitFile(path).get_messages('record', fields=fields))
+            self.assertEqual(len(projected), len(messages))
+            for message, projected_message in zip(messages, projected):
+                for field in fields:
+                    self.assertEqual(projected_message.get_value(field), message.get_value(field))
+                self.assertTrue(set(projected_message.get_values()) <= set(fields))
+
+    def test_get_messages_time_window(self):
+        for filename in FIT_FILES[:2]:
+            path = testfile(filename)
+            messages = list(FitFile(path).get_messages('record'))
+            start = messages[40].get_value('timestamp')
+            end = messages[130].get_value('timestamp')
+            expected = [m.get_values() for m in messages if start <= m.get_value('timestamp') <= end]
+            self.assertEqual(
+                [m.get_values() for m in FitFile(path).get_messages('record', start=start, end=end)], expected,
+            )
+            self.assertEqual(
+                [m.get_values() for m in UncachedFitFile(path).get_messages('record', start=start, end=end)],
+                expected,
+            )
+
+    def test_get_messages_parallel(self):
+        for filename in FIT_FILES:
+            path = testfile(filename)
+            messages = [m.as_dict() for m in FitFile(path).get_messages('record')]
+            fitfile = FitFile(path)
+            for checkpoint_interval in (37, 68):
+                index = fitfile.build_index(checkpoint_interval=checkpoint_interval)
+                for workers in (1, 2):
+                    self.assertEqual(
+                        list(fitfile.get_messages_parallel('record', workers=workers, index=index, chunk_size=1)),
+                        messages,
+                    )
+
+    def test_decode_many_reports_broken_files(self):
+        missing = os.path.join(self.tempdir, 'missing.fit')
+        truncated = os.path.join(self.tempdir, 'truncated.fit')
+        with open(truncated, 'wb') as f:
+            f.write(generate_fitfile()[:40])
+        paths = [self.path, missing, truncated, self.path]
+
+        for workers in (1, 2):
+            results = list(decode_many(paths, 'record', fields=['heart_rate'], workers=workers))
+            self.assertEqual([path for path, _ in results], paths)
+            self.assertEqual(len(results[0][1]['record']), NUM_RECORDS)
+            self.assertIsInstance(results[1][1], OSError)
+            self.assertIsInstance(results[2][1], FitParseError)
+            self.assertEqual(results[3][1], results[0][1])
+
+
+if __name__ == '__main__':
+    unittest.main()